@@ -94,7 +94,7 @@ async def evaluate_call(
                 correlation_id=correlation_id,
                 call_id=request.call_id,
                 agent_id=request.agent_id,
-                evaluation_result=evaluation_result.dict(),
+                evaluation_result=evaluation_result,
                 overall_score=overall_score,
                 processing_time_ms=processing_time_ms
             )
@@ -242,7 +242,7 @@ async def evaluate_batch(
                     correlation_id=call_correlation_id,
                     call_id=call_request.call_id,
                     agent_id=call_request.agent_id,
-                    evaluation_result=evaluation_result.dict(),
+                    evaluation_result=evaluation_result,
                     overall_score=overall_score,
                     processing_time_ms=processing_time_ms
                 )
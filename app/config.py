@@ -17,6 +17,7 @@ class Environment(str, Enum):
     DEVELOPMENT = "development"
     STAGING = "staging"
     PRODUCTION = "production"
+    TEST = "test"
 
 
 class LogLevel(str, Enum):
@@ -72,7 +73,7 @@ class Settings(BaseSettings):
     # === APPLICATION CONFIGURATION ===
     environment: Environment = Field(
         default=Environment.DEVELOPMENT,
-        description="Application environment (development/staging/production)"
+        description="Application environment (development/staging/production/test)"
     )
     port: int = Field(
         default=3000,
@@ -181,6 +182,10 @@ class Settings(BaseSettings):
         """Check if running in staging mode"""
         return self.environment == Environment.STAGING
     
+    def is_test(self) -> bool:
+        """Check if running in test mode"""
+        return self.environment == Environment.TEST
+    
     def get_log_config(self) -> dict:
         """Get logging configuration based on environment"""
         # Handle both enum and string values for log_level
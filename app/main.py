@@ -9,8 +9,9 @@ from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
+import asyncio
+import secrets
 import time
-import uuid
 from datetime import datetime
 
 from app.config import settings
@@ -22,11 +23,20 @@ logger = get_structured_logger(__name__)
 # API and service imports
 from app.api.routes import router
 from app.services.orchestrator import CallQAOrchestrator
-from app.services.database import DatabaseService
+from app.services.database import get_db_service
+from app.services.prompt_layer import close_promptlayer_client
 
 # Global service instances
 orchestrator = CallQAOrchestrator()
-db_service = DatabaseService()
+db_service = get_db_service()
+
+# Longest /health waits on the database probe, kept well under the
+# load balancer's health check interval
+DB_HEALTH_PROBE_TIMEOUT_SECONDS = 1.0
+# After a database probe times out, /health reports it unhealthy without
+# probing again until this monotonic deadline passes
+DB_HEALTH_BREAKER_SECONDS = 5.0
+_db_health_breaker_until = 0.0
 
 
 @asynccontextmanager
@@ -46,7 +56,8 @@ async def lifespan(app: FastAPI):
     
     logger.info("Shutting down Call QA API")
     # Cleanup services
-    await orchestrator.prompt_client.close()
+    await db_service.close()
+    await close_promptlayer_client()
 
 
 app = FastAPI(
@@ -74,7 +85,7 @@ app.include_router(router, prefix="/api/v1", tags=["evaluation"])
 async def log_requests(request: Request, call_next):
     """Request logging middleware with correlation ID tracking"""
     start_time = time.time()
-    request_id = f"req_{uuid.uuid4().hex[:12]}"
+    request_id = f"req_{secrets.token_hex(6)}"
     
     # Use request context for correlation tracking
     with request_context(request_id=request_id) as context:
@@ -125,14 +136,24 @@ async def log_requests(request: Request, call_next):
 @app.get("/health")
 async def health_check():
     """Enhanced health check endpoint for monitoring"""
+    global _db_health_breaker_until
     try:
         with TimedLogger(logger, "health check"):
-            # Check database connectivity
+            # Check database connectivity, bounded so a slow database cannot stall /health
             database_healthy = False
-            try:
-                database_healthy = await db_service.health_check()
-            except Exception as db_error:
-                logger.warning("Database health check failed", extra={"error": str(db_error)})
+            if time.monotonic() >= _db_health_breaker_until:
+                try:
+                    database_healthy = await asyncio.wait_for(
+                        db_service.health_check(),
+                        timeout=DB_HEALTH_PROBE_TIMEOUT_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    _db_health_breaker_until = time.monotonic() + DB_HEALTH_BREAKER_SECONDS
+                    logger.warning("Database health check timed out", extra={
+                        "timeout_seconds": DB_HEALTH_PROBE_TIMEOUT_SECONDS
+                    })
+                except Exception as db_error:
+                    logger.warning("Database health check failed", extra={"error": str(db_error)})
             
             # Check orchestrator initialization
             orchestrator_healthy = orchestrator.initialized if hasattr(orchestrator, 'initialized') else False
@@ -229,18 +250,22 @@ async def get_config():
 
 
 if __name__ == "__main__":
+    import os
     import uvicorn
     
+    # The reload file watcher adds latency, so it is off while profiling
+    reload = settings.is_development() and not os.getenv("PROFILE")
+    
     logger.info("Starting application server", extra={
         "host": "0.0.0.0",
         "port": settings.port,
-        "reload": settings.is_development()
+        "reload": reload
     })
     
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0", 
         port=settings.port,
-        reload=settings.is_development(),
+        reload=reload,
         log_level=settings.log_level.lower() if hasattr(settings.log_level, 'lower') else str(settings.log_level).lower()
     )
\ No newline at end of file
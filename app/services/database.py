@@ -5,17 +5,99 @@ Handles storage and retrieval of evaluation results with comprehensive
 error handling, retry logic, and connection management.
 """
 
+import asyncio
 import os
+import time
 from datetime import datetime
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from supabase import Client, create_client
 from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
 
+from app.config import settings
+from app.models.schemas import EvaluationResult
 from app.utils.logger import get_structured_logger
 
 logger = get_structured_logger(__name__)
 
+# Upper bound on API log rows coalesced into a single insert
+MERGE_BATCH_LIMIT = 100
+# Longest a buffered API log row waits for more rows to join its batch
+LOG_FLUSH_INTERVAL_SECONDS = 0.05
+# How long a health check result is reused before probing the database again
+HEALTH_CHECK_TTL_SECONDS = 5.0
+# Most Supabase requests allowed in flight at once, to stay within its connection limits
+MAX_CONCURRENT_REQUESTS = 10
+
+
+@lru_cache(maxsize=1)
+def _get_supabase_client(supabase_url: str, service_role_key: str) -> Client:
+    """Create the Supabase client once and share it across DatabaseService instances"""
+    return create_client(supabase_url, service_role_key)
+
+
+class _InMemoryResponse:
+    """Query result with the same data attribute as a Supabase response"""
+
+    def __init__(self, data: List[Dict[str, Any]]):
+        self.data = data
+
+
+class _InMemoryQuery:
+    """Supports the subset of the Supabase query builder DatabaseService uses"""
+
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self._rows = rows
+        self._result: Optional[List[Dict[str, Any]]] = None
+        self._limit: Optional[int] = None
+
+    def insert(self, data):
+        new_rows = data if isinstance(data, list) else [data]
+        self._rows.extend(dict(row) for row in new_rows)
+        self._result = new_rows
+        return self
+
+    def upsert(self, data, on_conflict: str = "id"):
+        new_rows = data if isinstance(data, list) else [data]
+        for row in new_rows:
+            for i, existing in enumerate(self._rows):
+                if existing.get(on_conflict) == row.get(on_conflict):
+                    self._rows[i] = dict(row)
+                    break
+            else:
+                self._rows.append(dict(row))
+        self._result = new_rows
+        return self
+
+    def select(self, columns: str = "*"):
+        fields = None if columns == "*" else [c.strip() for c in columns.split(",")]
+        self._result = [
+            row if fields is None else {f: row.get(f) for f in fields}
+            for row in self._rows
+        ]
+        return self
+
+    def limit(self, count: int):
+        self._limit = count
+        return self
+
+    def execute(self) -> _InMemoryResponse:
+        data = self._result or []
+        if self._limit is not None:
+            data = data[:self._limit]
+        return _InMemoryResponse(data)
+
+
+class _InMemoryClient:
+    """Process-local stand-in for the Supabase client used in the test environment"""
+
+    def __init__(self):
+        self.tables: Dict[str, List[Dict[str, Any]]] = {}
+
+    def table(self, name: str) -> _InMemoryQuery:
+        return _InMemoryQuery(self.tables.setdefault(name, []))
+
 
 class DatabaseService:
     """
@@ -38,28 +120,54 @@ class DatabaseService:
             raise ValueError("SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY must be configured")
 
         try:
-            self.client: Client = create_client(
-                self.supabase_url,
-                self.service_role_key
-            )
-            logger.info("Database client initialized successfully")
+            if settings.is_test():
+                # Tests run against process memory instead of the Supabase API
+                self.client = _InMemoryClient()
+            else:
+                self.client: Client = _get_supabase_client(
+                    self.supabase_url,
+                    self.service_role_key
+                )
+            logger.info("Database client initialized successfully", extra={
+                "backend": "memory" if settings.is_test() else "supabase"
+            })
+
+            # API log rows are buffered and written in batches by _flush_loop
+            self._log_buffer: Optional[asyncio.Queue] = None
+            self._flush_task: Optional[asyncio.Task] = None
+
+            # Last health probe as (monotonic timestamp, result)
+            self._health_cache: Optional[Tuple[float, bool]] = None
+            self._health_lock: Optional[asyncio.Lock] = None
+
+            # Bounds concurrent Supabase requests; see _execute
+            self._request_semaphore: Optional[asyncio.Semaphore] = None
         except Exception as e:
             logger.error("Failed to initialize database client", extra={
                 "error": str(e)
             })
             raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception(Exception)
-    )
+    async def _execute(self, query):
+        """
+        Execute a Supabase query off the event loop.
+        
+        The client is synchronous, so the request runs in a worker thread;
+        at most MAX_CONCURRENT_REQUESTS run at once so large batches queue
+        here instead of exhausting Supabase connections.
+        """
+        if self._request_semaphore is None:
+            self._request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        async with self._request_semaphore:
+            return await asyncio.to_thread(query.execute)
+
     async def store_evaluation_result(
         self,
         correlation_id: str,
         call_id: str,
         agent_id: str,
-        evaluation_result: Dict[str, Any],
+        evaluation_result: Union[EvaluationResult, Dict[str, Any]],
         overall_score: int,
         processing_time_ms: int
     ) -> None:
@@ -67,7 +175,8 @@ class DatabaseService:
         Store evaluation results in eavesly_evaluation_results table.
         
         Uses upsert logic to handle duplicate call_ids and includes all
-        metadata required for reporting and analysis.
+        metadata required for reporting and analysis. Pass the model itself
+        so it is dumped exactly once here; retries resend the same row.
         """
         try:
             # Handle both Pydantic models and dict objects
@@ -105,11 +214,7 @@ class DatabaseService:
                 "overall_score": overall_score
             })
 
-            # Use upsert to handle potential duplicate call_ids
-            response = self.client.table("eavesly_evaluation_results").upsert(
-                data,
-                on_conflict="call_id"
-            ).execute()
+            response = await self._upsert_evaluation_row(data)
 
             logger.info("Evaluation result stored successfully", extra={
                 "correlation_id": correlation_id,
@@ -126,6 +231,20 @@ class DatabaseService:
             }, exc_info=True)
             raise
 
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_exception(Exception)
+    )
+    async def _upsert_evaluation_row(self, data: Dict[str, Any]):
+        """Upsert a prepared evaluation row, keyed on call_id to handle duplicates"""
+        return await self._execute(
+            self.client.table("eavesly_evaluation_results").upsert(
+                data,
+                on_conflict="call_id"
+            )
+        )
+
     async def log_api_request(
         self,
         correlation_id: str,
@@ -138,59 +257,137 @@ class DatabaseService:
         """
         Log API request metadata in eavesly_api_logs table for audit trail.
         
-        This method is designed to be non-blocking - if logging fails,
-        it won't break the main API functionality.
+        The row is queued and returns immediately; a background task
+        coalesces queued rows into batched inserts. Logging failures never
+        break the main API functionality.
         """
-        try:
-            data = {
-                "correlation_id": correlation_id,
-                "endpoint": endpoint,
-                "http_method": http_method,
-                "http_status_code": status_code,
-                "processing_time_ms": processing_time_ms,
-                "error_message": error_message,
-                "request_timestamp": datetime.utcnow().isoformat()
-            }
+        data = {
+            "correlation_id": correlation_id,
+            "endpoint": endpoint,
+            "http_method": http_method,
+            "http_status_code": status_code,
+            "processing_time_ms": processing_time_ms,
+            "error_message": error_message,
+            "request_timestamp": datetime.utcnow().isoformat()
+        }
 
-            logger.debug("Logging API request", extra={
-                "correlation_id": correlation_id,
-                "endpoint": endpoint,
-                "status_code": status_code
-            })
+        logger.debug("Queueing API request log", extra={
+            "correlation_id": correlation_id,
+            "endpoint": endpoint,
+            "status_code": status_code
+        })
 
-            # Insert API log entry
-            self.client.table("eavesly_api_logs").insert(data).execute()
+        if self._log_buffer is None:
+            self._log_buffer = asyncio.Queue()
+        await self._log_buffer.put(data)
 
-            logger.debug("API request logged successfully", extra={
-                "correlation_id": correlation_id,
-                "endpoint": endpoint
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        """Drain the API log buffer in batches of up to MERGE_BATCH_LIMIT rows"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._log_buffer.get()]
+            deadline = loop.time() + LOG_FLUSH_INTERVAL_SECONDS
+
+            try:
+                while len(batch) < MERGE_BATCH_LIMIT:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._log_buffer.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+            finally:
+                # Rows already dequeued are written even if the loop is cancelled
+                await self._insert_api_logs(batch)
+
+    async def _insert_api_logs(self, rows: List[Dict[str, Any]]) -> None:
+        """Insert a batch of API log rows in a single round-trip"""
+        try:
+            await self._execute(self.client.table("eavesly_api_logs").insert(rows))
+
+            logger.debug("API request logs written", extra={
+                "row_count": len(rows)
             })
 
         except Exception as e:
             # Log the error but don't raise - API logging failures shouldn't break the main flow
-            logger.warning("Failed to log API request", extra={
-                "correlation_id": correlation_id,
-                "endpoint": endpoint,
+            logger.warning("Failed to log API requests", extra={
+                "row_count": len(rows),
                 "error": str(e)
             })
 
-    @retry(
-        stop=stop_after_attempt(2),
-        wait=wait_exponential(multiplier=1, min=1, max=5),
-        retry=retry_if_exception(Exception)
-    )
-    async def health_check(self) -> bool:
+    async def flush(self) -> None:
+        """Write all buffered API log rows immediately"""
+        if self._log_buffer is None:
+            return
+
+        rows = []
+        while not self._log_buffer.empty():
+            rows.append(self._log_buffer.get_nowait())
+
+        for start in range(0, len(rows), MERGE_BATCH_LIMIT):
+            await self._insert_api_logs(rows[start:start + MERGE_BATCH_LIMIT])
+
+    async def close(self) -> None:
+        """Stop the background flush task and write any pending API logs"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+
+        await self.flush()
+
+    async def health_check(self, force_refresh: bool = False) -> bool:
         """
         Check database connectivity and basic permissions.
         
         Returns True if database is accessible and basic operations work,
-        False otherwise. Uses minimal query to verify connectivity.
+        False otherwise. Results are reused for HEALTH_CHECK_TTL_SECONDS
+        unless force_refresh is set; concurrent callers share one probe.
         """
+        if not force_refresh and self._health_is_fresh():
+            return self._health_cache[1]
+
+        if self._health_lock is None:
+            self._health_lock = asyncio.Lock()
+
+        async with self._health_lock:
+            # Another caller may have refreshed the result while we waited
+            if not force_refresh and self._health_is_fresh():
+                return self._health_cache[1]
+
+            is_healthy = await self._probe_health()
+            self._health_cache = (time.monotonic(), is_healthy)
+            return is_healthy
+
+    def _health_is_fresh(self) -> bool:
+        """Whether the cached health check result is still within its TTL"""
+        return (
+            self._health_cache is not None
+            and time.monotonic() - self._health_cache[0] < HEALTH_CHECK_TTL_SECONDS
+        )
+
+    @retry(
+        stop=stop_after_attempt(2),
+        wait=wait_exponential(multiplier=1, min=1, max=5),
+        retry=retry_if_exception(Exception)
+    )
+    async def _probe_health(self) -> bool:
+        """Run a minimal query to verify connectivity"""
         try:
             logger.debug("Performing database health check")
 
             # Simple query to test connectivity - try to read from one of our tables
-            response = self.client.table("eavesly_evaluation_results").select("call_id").limit(1).execute()
+            response = await self._execute(
+                self.client.table("eavesly_evaluation_results").select("call_id").limit(1)
+            )
 
             # If we get here without exception, database is accessible
             is_healthy = True
@@ -207,3 +404,20 @@ class DatabaseService:
             })
 
         return is_healthy
+
+
+# Shared service instance (lazy initialization)
+_db_service_instance: Optional[DatabaseService] = None
+
+
+def get_db_service() -> DatabaseService:
+    """
+    Get the shared DatabaseService instance.
+
+    Building the service creates the Supabase client, so it is done on first
+    access and the instance is reused for the life of the process.
+    """
+    global _db_service_instance
+    if _db_service_instance is None:
+        _db_service_instance = DatabaseService()
+    return _db_service_instance
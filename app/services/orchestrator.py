@@ -18,7 +18,7 @@ from app.models.schemas import (
     ScriptAdherence,
 )
 from app.services.llm_client import FallbackManager, StructuredLLMClient
-from app.services.prompt_layer import PromptLayerClient
+from app.services.prompt_layer import get_promptlayer_client
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -27,11 +27,27 @@ logger = get_logger(__name__)
 class CallQAOrchestrator:
     """Main orchestrator for call quality evaluation"""
 
+    # Customer impact severities that map directly to a reputational risk level
+    _REPUTATIONAL_RISK_BY_SEVERITY = {"Critical": "high"}
+
+    # PromptLayer templates used by the evaluation workflow
+    TEMPLATE_NAMES = (
+        "call_qa_router_classifier",
+        "call_qa_script_deviation",
+        "call_qa_compliance",
+        "call_qa_communication",
+        "call_qa_deep_dive",
+    )
+
+    # Upper bound on the startup warm-up; it must never hold up serving
+    TEMPLATE_PRELOAD_TIMEOUT_SECONDS = 10.0
+
     def __init__(self):
         self.llm_client = StructuredLLMClient()
-        self.prompt_client = PromptLayerClient()
+        self.prompt_client = get_promptlayer_client()
         self.fallback_manager = FallbackManager()
         self.initialized = False
+        self._preload_task: Optional[asyncio.Task] = None
 
     async def initialize(self):
         """Initialize orchestrator by fetching all prompt templates"""
@@ -39,9 +55,26 @@ class CallQAOrchestrator:
             return
 
         logger.info("Initializing orchestrator...")
+        # Opens the shared PromptLayer connection before the first request.
+        # execute_prompt_template renders server-side and does not read the
+        # template cache, so run this in the background rather than awaiting it.
+        self._preload_task = asyncio.create_task(self._preload_templates())
         self.initialized = True
         logger.info("Orchestrator initialized successfully")
 
+    async def _preload_templates(self) -> None:
+        """Preload workflow templates, giving up after the startup bound"""
+        try:
+            await asyncio.wait_for(
+                self.prompt_client.preload_templates(list(self.TEMPLATE_NAMES)),
+                timeout=self.TEMPLATE_PRELOAD_TIMEOUT_SECONDS
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Template preload timed out",
+                extra={"timeout_seconds": self.TEMPLATE_PRELOAD_TIMEOUT_SECONDS}
+            )
+
     async def evaluate_call(self, request: EvaluateCallRequest) -> EvaluationResult:
         """
         Main evaluation method - orchestrates all evaluation steps
@@ -706,46 +739,51 @@ class CallQAOrchestrator:
         financial_profile: Optional[Any]
     ) -> Dict[str, Any]:
         """Assess the impact on customer experience and satisfaction"""
-        impact = {
-            "severity": "Low",
-            "factors": [],
-            "harm_indicators": [],
-            "trust_impact": "minimal"
-        }
+        # Accumulate in locals and build the result dict once at the end
+        severity = "Low"
+        trust_impact = "minimal"
+        factors: List[str] = []
+        harm_indicators: List[str] = []
 
         # Assess compliance violations impact
         if len(compliance.summary.violations) > 0:
-            impact["severity"] = "High"
-            impact["factors"].append("regulatory_violation")
-            impact["harm_indicators"].extend(compliance.summary.violations)
-            impact["trust_impact"] = "significant"
+            severity = "High"
+            factors.append("regulatory_violation")
+            harm_indicators.extend(compliance.summary.violations)
+            trust_impact = "significant"
 
         # Assess red flags impact
         if len(classification.red_flags) >= 2:
-            if impact["severity"] in ["Low", "Medium"]:
-                impact["severity"] = "High"
-            impact["factors"].append("multiple_red_flags")
-            impact["trust_impact"] = "moderate" if impact["trust_impact"] == "minimal" else impact["trust_impact"]
+            if severity in ("Low", "Medium"):
+                severity = "High"
+            factors.append("multiple_red_flags")
+            if trust_impact == "minimal":
+                trust_impact = "moderate"
 
         # Assess termination reason impact
         if script_progress.termination_reason == "agent_error":
-            impact["severity"] = "High"
-            impact["factors"].append("agent_error")
-            impact["harm_indicators"].append("Unprofessional call termination")
-            impact["trust_impact"] = "significant"
+            severity = "High"
+            factors.append("agent_error")
+            harm_indicators.append("Unprofessional call termination")
+            trust_impact = "significant"
         elif script_progress.termination_reason == "not_interested" and not classification.early_termination_justified:
-            if impact["severity"] == "Low":
-                impact["severity"] = "Medium"
-            impact["factors"].append("unjustified_termination")
+            if severity == "Low":
+                severity = "Medium"
+            factors.append("unjustified_termination")
 
         # Financial context impact
         if financial_profile and financial_profile.loan_approval_status == "denied":
-            impact["factors"].append("sensitive_financial_situation")
+            factors.append("sensitive_financial_situation")
             if len(compliance.summary.violations) > 0:
-                impact["severity"] = "Critical"
-                impact["harm_indicators"].append("Potential discrimination or unfair treatment")
+                severity = "Critical"
+                harm_indicators.append("Potential discrimination or unfair treatment")
 
-        return impact
+        return {
+            "severity": severity,
+            "factors": factors,
+            "harm_indicators": harm_indicators,
+            "trust_impact": trust_impact
+        }
 
     def _assess_reputational_risk(
         self,
@@ -753,10 +791,11 @@ class CallQAOrchestrator:
         customer_impact_analysis: Dict[str, Any]
     ) -> str:
         """Assess reputational risk based on issues and customer impact"""
-        if customer_impact_analysis["severity"] == "Critical":
-            return "high"
-        elif (issues_analysis["critical_issues"] >= 2 or
-              customer_impact_analysis["trust_impact"] == "significant"):
-            return "medium"
-        else:
-            return "low"
+        return self._REPUTATIONAL_RISK_BY_SEVERITY.get(
+            customer_impact_analysis["severity"]
+        ) or (
+            "medium"
+            if issues_analysis["critical_issues"] >= 2
+            or customer_impact_analysis["trust_impact"] == "significant"
+            else "low"
+        )
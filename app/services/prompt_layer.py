@@ -4,9 +4,14 @@ PromptLayer integration for prompt template management.
 Fetches and manages prompt templates for LLM evaluations.
 """
 
+import asyncio
 import json
 import os
-from datetime import datetime, timedelta
+import re
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from functools import lru_cache
 from typing import Any, Optional, Union
 
 import httpx
@@ -15,6 +20,63 @@ from tenacity import retry, stop_after_attempt, wait_exponential
 from app.utils.logger import get_structured_logger
 
 
+# {{variable}} placeholders; any key without braces, as with plain replacement
+_PLACEHOLDER_PATTERN = re.compile(r"\{\{([^{}]+)\}\}")
+
+
+@lru_cache(maxsize=1024)
+def _compile_format_string(template: str) -> tuple[str, tuple[str, ...]]:
+    """
+    Convert a {{variable}} template into a positional str.format string.
+
+    Returns the format string and the placeholder keys in field order. Keys
+    are looked up by the caller, so they need not be valid format field names.
+    """
+    parts = []
+    keys = []
+    last_end = 0
+
+    for match in _PLACEHOLDER_PATTERN.finditer(template):
+        literal = template[last_end:match.start()]
+        parts.append(literal.replace("{", "{{").replace("}", "}}"))
+        parts.append("{}")
+        keys.append(match.group(1))
+        last_end = match.end()
+
+    parts.append(template[last_end:].replace("{", "{{").replace("}", "}}"))
+    return "".join(parts), tuple(keys)
+
+
+class _TemplateVariables(dict):
+    """
+    Lazily serialized variables for template rendering.
+
+    Values are encoded on first lookup and memoized for the rest of the
+    render call. Unknown names render back as their {{placeholder}} and are
+    recorded in `missing`.
+    """
+
+    def __init__(self, variables: dict[str, Any]):
+        super().__init__()
+        self.variables = variables
+        self.missing: list[str] = []
+
+    def __missing__(self, key: str) -> str:
+        if key not in self.variables:
+            self.missing.append(key)
+            return f"{{{{{key}}}}}"
+
+        value = self.variables[key]
+        # Handle complex values (lists, dicts) by JSON serialization
+        if isinstance(value, (dict, list)):
+            value_str = json.dumps(value, ensure_ascii=False, indent=2)
+        else:
+            value_str = str(value)
+
+        self[key] = value_str
+        return value_str
+
+
 class PromptLayerError(Exception):
     """Base exception for PromptLayer operations"""
     pass
@@ -39,13 +101,19 @@ class PromptLayerValidationError(PromptLayerError):
 class PromptLayerClient:
     """Client for fetching prompt templates from PromptLayer"""
 
-    def __init__(self, api_key: Optional[str] = None, cache_ttl_minutes: int = 60):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache_ttl_minutes: int = 60,
+        cache_max_entries: int = 256
+    ):
         """
         Initialize PromptLayer client.
 
         Args:
             api_key: PromptLayer API key, defaults to PROMPTLAYER_API_KEY env var
             cache_ttl_minutes: Cache TTL for templates in minutes
+            cache_max_entries: Maximum cached templates before LRU eviction
         """
         self.api_key = api_key or os.getenv("PROMPTLAYER_API_KEY")
         if not self.api_key:
@@ -53,8 +121,13 @@ class PromptLayerClient:
 
         self.base_url = "https://api.promptlayer.com"
         self.cache_ttl = timedelta(minutes=cache_ttl_minutes)
-        self.templates_cache: dict[str, dict[str, Any]] = {}
-        self.cache_timestamps: dict[str, datetime] = {}
+        self.cache_ttl_seconds = cache_ttl_minutes * 60.0
+        self.cache_max_entries = cache_max_entries
+        self.templates_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        # Monotonic timestamps so TTLs are immune to wall-clock jumps
+        self.cache_timestamps: dict[str, float] = {}
+        # Cache keys grouped by template name for O(versions) invalidation
+        self._versions_by_name: dict[str, set[str]] = {}
         self.logger = get_structured_logger(__name__)
 
         # Initialize HTTP client
@@ -67,20 +140,51 @@ class PromptLayerClient:
             timeout=30.0
         )
 
+        # Type-keyed dispatch for the recursive template walk
+        self._render_dispatch = {
+            str: self._render_string_template,
+            list: self._render_list_template,
+            dict: self._render_dict_template,
+        }
+
     def _is_cache_valid(self, template_name: str) -> bool:
         """Check if cached template is still valid"""
         if template_name not in self.cache_timestamps:
             return False
 
         cache_time = self.cache_timestamps[template_name]
-        return datetime.utcnow() - cache_time < self.cache_ttl
+        return time.monotonic() - cache_time < self.cache_ttl_seconds
+
+    @staticmethod
+    def _base_template_name(cache_key: str) -> str:
+        """Strip the ':v<version>' suffix from a cache key"""
+        return cache_key.split(":v", 1)[0]
+
+    def _unindex_cache_key(self, cache_key: str) -> None:
+        """Remove a cache key from the per-template version index"""
+        base_name = self._base_template_name(cache_key)
+        versions = self._versions_by_name.get(base_name)
+        if versions is not None:
+            versions.discard(cache_key)
+            if not versions:
+                del self._versions_by_name[base_name]
 
     def _cache_template(
         self, template_name: str, template_data: dict[str, Any]
     ) -> None:
         """Cache template data with timestamp"""
         self.templates_cache[template_name] = template_data
-        self.cache_timestamps[template_name] = datetime.utcnow()
+        self.templates_cache.move_to_end(template_name)
+        self.cache_timestamps[template_name] = time.monotonic()
+        self._versions_by_name.setdefault(
+            self._base_template_name(template_name), set()
+        ).add(template_name)
+
+        # Evict least recently used templates once over capacity
+        while len(self.templates_cache) > self.cache_max_entries:
+            evicted_key, _ = self.templates_cache.popitem(last=False)
+            self.cache_timestamps.pop(evicted_key, None)
+            self._unindex_cache_key(evicted_key)
 
         self.logger.debug(
             "Cached template",
@@ -173,7 +277,10 @@ class PromptLayerClient:
                 extra={
                     "template_name": prompt_name,
                     "version": version,
-                    "response_size": len(str(result_data))
+                    "response_size": int(
+                        response.headers.get("content-length")
+                        or len(response.content)
+                    )
                 }
             )
 
@@ -268,6 +375,7 @@ class PromptLayerClient:
                 "Retrieved template from cache",
                 extra={"template_name": prompt_name, "version": version}
             )
+            self.templates_cache.move_to_end(cache_key)
             return self.templates_cache[cache_key]
 
         # Prepare API request - POST to fetch template
@@ -345,6 +453,35 @@ class PromptLayerClient:
             )
             raise PromptLayerError(f"Unexpected error: {str(e)}") from e
 
+    async def preload_templates(self, names: list[str]) -> None:
+        """
+        Concurrently fetch a working set of templates into the cache.
+
+        Intended for application startup so the first request does not pay
+        the PromptLayer round-trip. Failures are logged, not raised.
+
+        Args:
+            names: Template names to fetch
+        """
+        results = await asyncio.gather(
+            *(self.fetch_prompt_template(name) for name in names),
+            return_exceptions=True
+        )
+
+        failed = [
+            name for name, result in zip(names, results)
+            if isinstance(result, Exception)
+        ]
+
+        self.logger.info(
+            "Preloaded templates",
+            extra={
+                "requested": len(names),
+                "loaded": len(names) - len(failed),
+                "failed_templates": failed
+            }
+        )
+
     def _validate_template_data(
         self, template_data: dict[str, Any], template_name: str
     ) -> None:
@@ -421,32 +558,17 @@ class PromptLayerClient:
             PromptLayerValidationError: When required variables are missing
         """
         try:
-            if isinstance(template, str):
-                return self._render_string_template(template, variables)
-
-            elif isinstance(template, list):
-                # Chat format - render each message
-                return [
-                    {
-                        **message,
-                        "content": self._render_string_template(
-                            str(message.get("content", "")), variables
-                        )
-                    }
-                    for message in template
-                ]
-
-            elif isinstance(template, dict):
-                # Structured template - recursively render string values
-                return self._render_dict_template(template, variables)
-
-            else:
+            render = self._render_dispatch.get(type(template))
+            if render is None:
                 self.logger.warning(
                     "Unsupported template type for rendering",
                     extra={"template_type": type(template).__name__}
                 )
                 return template
 
+            # Per-call memo so each variable is serialized at most once
+            return render(template, variables, _TemplateVariables(variables))
+
         except Exception as e:
             self.logger.error(
                 "Error rendering template",
@@ -458,25 +580,27 @@ class PromptLayerClient:
             ) from e
 
     def _render_string_template(
-        self, template: str, variables: dict[str, Any]
+        self,
+        template: str,
+        variables: dict[str, Any],
+        encoded: Optional[_TemplateVariables] = None
     ) -> str:
         """Render a string template with variable substitution"""
-        rendered = template
+        if encoded is None:
+            encoded = _TemplateVariables(variables)
 
-        for key, value in variables.items():
-            placeholder = f"{{{{{key}}}}}"
+        # Fast path: the whole string is a single placeholder
+        if template.startswith("{{") and template.endswith("}}"):
+            key = template[2:-2]
+            if key in variables:
+                return encoded[key]
 
-            # Handle complex values (lists, dicts) by JSON serialization
-            if isinstance(value, (dict, list)):
-                value_str = json.dumps(value, ensure_ascii=False, indent=2)
-            else:
-                value_str = str(value)
-
-            rendered = rendered.replace(placeholder, value_str)
+        missing_before = len(encoded.missing)
+        format_string, keys = _compile_format_string(template)
+        rendered = format_string.format(*[encoded[key] for key in keys])
 
         # Check for remaining unsubstituted variables
-        import re
-        remaining_vars = re.findall(r'\{\{(\w+)\}\}', rendered)
+        remaining_vars = encoded.missing[missing_before:]
         if remaining_vars:
             self.logger.warning(
                 "Template has unsubstituted variables",
@@ -489,29 +613,36 @@ class PromptLayerClient:
         return rendered
 
     def _render_dict_template(
-        self, template: dict, variables: dict[str, Any]
+        self,
+        template: dict,
+        variables: dict[str, Any],
+        encoded: Optional[_TemplateVariables] = None
     ) -> dict:
         """Recursively render dictionary template"""
+        if encoded is None:
+            encoded = _TemplateVariables(variables)
         rendered = {}
 
         for key, value in template.items():
-            if isinstance(value, str):
-                rendered[key] = self._render_string_template(value, variables)
-            elif isinstance(value, dict):
-                rendered[key] = self._render_dict_template(value, variables)
-            elif isinstance(value, list):
-                rendered[key] = [
-                    (
-                        self._render_string_template(str(item), variables)
-                        if isinstance(item, str)
-                        else self._render_dict_template(item, variables)
-                        if isinstance(item, dict)
-                        else item
-                    )
-                    for item in value
-                ]
-            else:
-                rendered[key] = value
+            render = self._render_dispatch.get(type(value))
+            rendered[key] = render(value, variables, encoded) if render else value
+
+        return rendered
+
+    def _render_list_template(
+        self,
+        template: list,
+        variables: dict[str, Any],
+        encoded: Optional[_TemplateVariables] = None
+    ) -> list:
+        """Recursively render list template (e.g. chat messages)"""
+        if encoded is None:
+            encoded = _TemplateVariables(variables)
+        rendered = []
+
+        for item in template:
+            render = self._render_dispatch.get(type(item))
+            rendered.append(render(item, variables, encoded) if render else item)
 
         return rendered
 
@@ -523,11 +654,16 @@ class PromptLayerClient:
             template_name: Specific template to clear, or None to clear all
         """
         if template_name:
-            # Clear specific template and its versions
-            keys_to_remove = [
-                key for key in self.templates_cache.keys()
-                if key == template_name or key.startswith(f"{template_name}:v")
-            ]
+            base_name = self._base_template_name(template_name)
+            if base_name == template_name:
+                # Clear the template and all of its cached versions
+                keys_to_remove = self._versions_by_name.pop(template_name, set())
+            else:
+                # A versioned key clears only that version
+                keys_to_remove = (
+                    {template_name} if template_name in self.templates_cache else set()
+                )
+                self._unindex_cache_key(template_name)
 
             for key in keys_to_remove:
                 self.templates_cache.pop(key, None)
@@ -545,6 +681,7 @@ class PromptLayerClient:
             cache_size = len(self.templates_cache)
             self.templates_cache.clear()
             self.cache_timestamps.clear()
+            self._versions_by_name.clear()
 
             self.logger.info(
                 "Cleared all template cache",
@@ -553,17 +690,17 @@ class PromptLayerClient:
 
     def get_cache_stats(self) -> dict[str, Any]:
         """Get cache statistics"""
-        now = datetime.utcnow()
+        now = time.monotonic()
         valid_count = sum(
             1 for timestamp in self.cache_timestamps.values()
-            if now - timestamp < self.cache_ttl
+            if now - timestamp < self.cache_ttl_seconds
         )
 
         return {
             "total_cached": len(self.templates_cache),
             "valid_cached": valid_count,
             "expired_cached": len(self.templates_cache) - valid_count,
-            "cache_ttl_minutes": self.cache_ttl.total_seconds() / 60
+            "cache_ttl_minutes": self.cache_ttl_seconds / 60
         }
 
     async def close(self) -> None:
@@ -572,3 +709,26 @@ class PromptLayerClient:
             await self.client.aclose()
             self.logger.debug("Closed PromptLayer HTTP client")
 
+
+_client_instance: Optional[PromptLayerClient] = None
+
+
+def get_promptlayer_client() -> PromptLayerClient:
+    """
+    Get the shared PromptLayer client instance.
+
+    The client owns an HTTP connection pool and the template cache, so it is
+    created on first access and reused for the life of the process.
+    """
+    global _client_instance
+    if _client_instance is None:
+        _client_instance = PromptLayerClient()
+    return _client_instance
+
+
+async def close_promptlayer_client() -> None:
+    """Close the shared PromptLayer client, if one was created"""
+    global _client_instance
+    if _client_instance is not None:
+        await _client_instance.close()
+        _client_instance = None
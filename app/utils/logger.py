@@ -5,16 +5,21 @@ Provides comprehensive logging with JSON formatting for production,
 correlation ID support, and context management for request tracking.
 """
 
+import atexit
+import copy
 import logging
+import os
+import queue
+import secrets
 import sys
+import threading
 import json
 import time
-import uuid
 from datetime import datetime
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Optional, Tuple, Union
 from contextlib import contextmanager
 from contextvars import ContextVar
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 try:
     from pythonjsonlogger import jsonlogger
     HAS_JSON_LOGGER = True
@@ -22,36 +27,88 @@ except ImportError:
     # Fallback if pythonjsonlogger is not available
     jsonlogger = None
     HAS_JSON_LOGGER = False
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    # Fallback to stdlib json if orjson is not available
+    orjson = None
+    HAS_ORJSON = False
 
 # Context variables for correlation tracking
 correlation_id_var: ContextVar[Optional[str]] = ContextVar('correlation_id', default=None)
 request_id_var: ContextVar[Optional[str]] = ContextVar('request_id', default=None)
 user_id_var: ContextVar[Optional[str]] = ContextVar('user_id', default=None)
 
+# Record attributes populated from the correlation ContextVars
+_CORRELATION_KEYS = frozenset({'correlation_id', 'request_id', 'user_id'})
+
+# Service metadata attached to structured logs
+SERVICE_NAME = "pennie-call-qa"
+SERVICE_VERSION = "1.0.0"
+
 # Global logging configuration
 _logging_configured = False
+_logging_config_lock = threading.Lock()
+
+# Background listener that performs file log I/O off the calling thread
+_file_log_listener: Optional[QueueListener] = None
+
+# Last formatted (epoch second, ISO prefix) pair for timestamp formatting
+_iso_second_cache: Tuple[int, str] = (-1, "")
+
+
+def _json_dumps(log_obj: Dict[str, Any]) -> str:
+    """Serialize a log record dict, using orjson when available"""
+    if HAS_ORJSON:
+        return orjson.dumps(
+            log_obj, default=str, option=orjson.OPT_NON_STR_KEYS
+        ).decode()
+    return json.dumps(log_obj, default=str)
 
 
-class ContextFilter(logging.Filter):
+def _format_iso_timestamp(created: float) -> str:
+    """Format an epoch timestamp as ISO-8601 UTC, reusing the per-second prefix"""
+    global _iso_second_cache
+    seconds = int(created)
+    cached_seconds, prefix = _iso_second_cache
+    if seconds != cached_seconds:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))
+        _iso_second_cache = (seconds, prefix)
+    return f"{prefix}.{int((created - seconds) * 1_000_000):06d}Z"
+
+
+class ContextLogRecord(logging.LogRecord):
     """
-    Logging filter that adds correlation ID and other context to log records.
+    LogRecord that captures correlation context and timestamp at creation.
+    
+    Installed via logging.setLogRecordFactory so context is attached once per
+    record instead of by a filter on every handler. Context fields default to
+    class attributes and are only written to the instance when set, so an
+    explicit `extra` value can still fill them otherwise.
     """
     
-    def filter(self, record: logging.LogRecord) -> bool:
-        """Add context variables to the log record"""
-        # Add correlation ID if available
-        record.correlation_id = correlation_id_var.get(None)
-        record.request_id = request_id_var.get(None) 
-        record.user_id = user_id_var.get(None)
+    correlation_id: Optional[str] = None
+    request_id: Optional[str] = None
+    user_id: Optional[str] = None
+    service = SERVICE_NAME
+    version = SERVICE_VERSION
+    
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
         
         # Add timestamp in ISO format for consistency
-        record.timestamp = datetime.utcnow().isoformat() + 'Z'
-        
-        # Add service information
-        record.service = "pennie-call-qa"
-        record.version = "1.0.0"
+        self.timestamp = _format_iso_timestamp(self.created)
         
-        return True
+        correlation_id = correlation_id_var.get(None)
+        if correlation_id is not None:
+            self.correlation_id = correlation_id
+        request_id = request_id_var.get(None)
+        if request_id is not None:
+            self.request_id = request_id
+        user_id = user_id_var.get(None)
+        if user_id is not None:
+            self.user_id = user_id
 
 
 class ConsoleFormatter(logging.Formatter):
@@ -71,23 +128,38 @@ class ConsoleFormatter(logging.Formatter):
             'CRITICAL': '\033[35m', # Magenta
             'RESET': '\033[0m'      # Reset
         }
+        
+        # Precomputed colored level labels and short logger names
+        reset_color = self.colors['RESET']
+        self._colored_levels = {
+            level: f"{color}{level}{reset_color}"
+            for level, color in self.colors.items()
+            if level != 'RESET'
+        }
+        self._short_names: Dict[str, str] = {}
     
     def format(self, record: logging.LogRecord) -> str:
         """Format log record for console output"""
         # Color the log level
-        level_color = self.colors.get(record.levelname, '')
-        reset_color = self.colors['RESET']
-        colored_level = f"{level_color}{record.levelname}{reset_color}"
+        colored_level = self._colored_levels.get(record.levelname)
+        if colored_level is None:
+            colored_level = f"{record.levelname}{self.colors['RESET']}"
         
         # Build the log message
-        timestamp = datetime.fromtimestamp(record.created).strftime('%H:%M:%S.%f')[:-3]
-        logger_name = record.name.split('.')[-1]  # Just the last part
+        timestamp = (
+            f"{time.strftime('%H:%M:%S', time.localtime(record.created))}"
+            f".{int(record.msecs):03d}"
+        )
+        logger_name = self._short_names.get(record.name)
+        if logger_name is None:
+            logger_name = record.name.split('.')[-1]  # Just the last part
+            self._short_names[record.name] = logger_name
         
         # Base message
         message = f"{timestamp} {colored_level:>8} [{logger_name}] {record.getMessage()}"
         
         # Add correlation ID if present
-        correlation_id = getattr(record, 'correlation_id', None)
+        correlation_id = record.correlation_id
         if correlation_id:
             message += f" [corr_id={correlation_id[:8]}]"
         
@@ -113,14 +185,25 @@ if HAS_JSON_LOGGER:
         def process_log_record(self, log_record: Dict[str, Any]) -> Dict[str, Any]:
             """Process and enrich log record"""
             # Add context information
-            log_record['service'] = 'pennie-call-qa'
-            log_record['version'] = '1.0.0'
+            log_record['service'] = SERVICE_NAME
+            log_record['version'] = SERVICE_VERSION
             
             # Ensure timestamp is properly formatted
             if 'timestamp' not in log_record:
                 log_record['timestamp'] = datetime.utcnow().isoformat() + 'Z'
             
             return super().process_log_record(log_record)
+
+        def jsonify_log_record(self, log_record: Dict[str, Any]) -> str:
+            """Serialize the log record with the fastest available encoder"""
+            return _json_dumps(log_record)
+
+        def format(self, record: logging.LogRecord) -> str:
+            """Format once per record and reuse the JSON across handlers"""
+            cached_json = record.__dict__.get('_cached_json')
+            if cached_json is None:
+                cached_json = record._cached_json = super().format(record)
+            return cached_json
 else:
     class JSONFormatter(logging.Formatter):
         """
@@ -132,26 +215,143 @@ else:
         
         def format(self, record: logging.LogRecord) -> str:
             """Format log record as JSON string"""
+            # Reuse the JSON if another handler already formatted this record
+            cached_json = record.__dict__.get('_cached_json')
+            if cached_json is not None:
+                return cached_json
+            
             log_obj = {
-                'timestamp': datetime.utcnow().isoformat() + 'Z',
+                'timestamp': _format_iso_timestamp(record.created),
                 'level': record.levelname,
                 'logger': record.name,
                 'message': record.getMessage(),
-                'service': 'pennie-call-qa',
-                'version': '1.0.0'
+                'service': SERVICE_NAME,
+                'version': SERVICE_VERSION
             }
             
-            # Add context if available
-            for attr in ['correlation_id', 'request_id', 'user_id']:
-                value = getattr(record, attr, None)
-                if value:
-                    log_obj[attr] = value
+            # Add context if available (ContextLogRecord defaults these to None)
+            if record.correlation_id:
+                log_obj['correlation_id'] = record.correlation_id
+            if record.request_id:
+                log_obj['request_id'] = record.request_id
+            if record.user_id:
+                log_obj['user_id'] = record.user_id
             
             # Add exception info if present
             if record.exc_info:
                 log_obj['exception'] = self.formatException(record.exc_info)
             
-            return json.dumps(log_obj)
+            record._cached_json = _json_dumps(log_obj)
+            return record._cached_json
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler that buffers writes instead of flushing per record.
+    
+    The log file is opened with a large write buffer. It is flushed when a
+    record at or above `flush_level` is written, every `flush_interval`
+    seconds from a background thread, on rollover, and on close.
+    """
+    
+    def __init__(
+        self,
+        filename: str,
+        *args: Any,
+        buffer_size: int = 64 * 1024,
+        flush_level: int = logging.ERROR,
+        flush_interval: float = 1.0,
+        **kwargs: Any
+    ):
+        # Set before the base class opens the stream via _open()
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        self.flush_interval = flush_interval
+        super().__init__(filename, *args, **kwargs)
+        
+        self._flush_stop = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically,
+            name="log-file-flusher",
+            daemon=True
+        )
+        self._flusher.start()
+    
+    def _open(self):
+        """Open the log file with a large write buffer"""
+        stream = open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors
+        )
+        # Track the file size ourselves: tell() on a text stream flushes its buffer
+        self._bytes_written = os.path.getsize(self.baseFilename)
+        return stream
+    
+    def doRollover(self) -> None:
+        """Rotate the file and restart the size count"""
+        super().doRollover()
+        self._bytes_written = 0
+    
+    def _flush_periodically(self) -> None:
+        """Flush buffered records until the handler is closed"""
+        while not self._flush_stop.wait(self.flush_interval):
+            self.flush()
+    
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """Size-only check that never formats the record"""
+        if self.stream is None:
+            self.stream = self._open()
+        return 0 < self.maxBytes <= self._bytes_written
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write the record, flushing only for high-severity records"""
+        try:
+            # Format once and use the result for both the size check and the
+            # write (the stdlib handler formats twice per record)
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            msg_bytes = len(msg.encode(self.stream.encoding, self.stream.errors))
+            if 0 < self.maxBytes <= self._bytes_written + msg_bytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            
+            self.stream.write(msg)
+            self._bytes_written += msg_bytes
+            
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def close(self) -> None:
+        """Stop the periodic flusher and close the file"""
+        self._flush_stop.set()
+        super().close()
+
+
+class StructuredQueueHandler(QueueHandler):
+    """
+    Queue handler that leaves formatting to the handlers behind the queue.
+    
+    The stock prepare() formats the record with the default formatter, folds
+    the traceback into the message and drops exc_info, so the JSON file
+    formatter could no longer emit the exception as its own field.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Resolve the message arguments but keep the exception details"""
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
 
 
 def configure_logging(
@@ -173,58 +373,73 @@ def configure_logging(
         max_file_size: Maximum size of log file before rotation
         backup_count: Number of backup files to keep
     """
-    global _logging_configured
+    global _logging_configured, _file_log_listener
     
     if _logging_configured:
         return
     
-    # Get root logger
-    root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
+    # Double-checked so concurrent startup cannot install handlers twice
+    with _logging_config_lock:
+        if _logging_configured:
+            return
+    
+        # Attach correlation context to every record at creation time, once per
+        # record regardless of handler count (root-logger filters would be skipped
+        # for records propagated from child loggers)
+        logging.setLogRecordFactory(ContextLogRecord)
     
-    # Clear existing handlers
-    root_logger.handlers.clear()
+        # Get root logger
+        root_logger = logging.getLogger()
+        root_logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
     
-    # Create console handler
-    console_handler = logging.StreamHandler(sys.stdout)
+        # Clear existing handlers
+        root_logger.handlers.clear()
     
-    # Set formatter based on format type
-    if log_format == "json":
-        formatter = JSONFormatter()
-    else:
-        formatter = ConsoleFormatter()
+        # Create console handler
+        console_handler = logging.StreamHandler(sys.stdout)
     
-    console_handler.setFormatter(formatter)
-    console_handler.addFilter(ContextFilter())
-    root_logger.addHandler(console_handler)
+        # Set formatter based on format type
+        if log_format == "json":
+            formatter = JSONFormatter()
+        else:
+            formatter = ConsoleFormatter()
+    
+        console_handler.setFormatter(formatter)
+        root_logger.addHandler(console_handler)
     
-    # Add file handler if enabled
-    if enable_file_logging:
-        import os
-        os.makedirs(os.path.dirname(log_file_path), exist_ok=True)
+        # Add file handler if enabled
+        if enable_file_logging:
+            os.makedirs(os.path.dirname(log_file_path), exist_ok=True)
         
-        file_handler = RotatingFileHandler(
-            log_file_path,
-            maxBytes=max_file_size,
-            backupCount=backup_count
-        )
+            file_handler = BufferedRotatingFileHandler(
+                log_file_path,
+                maxBytes=max_file_size,
+                backupCount=backup_count
+            )
         
-        # Always use JSON format for file logs
-        file_formatter = JSONFormatter()
-        file_handler.setFormatter(file_formatter)
-        file_handler.addFilter(ContextFilter())
-        root_logger.addHandler(file_handler)
+            # Always use JSON format for file logs
+            file_formatter = JSONFormatter()
+            file_handler.setFormatter(file_formatter)
+        
+            # Hand records to a background thread so callers only pay a queue put
+            log_queue: queue.SimpleQueue = queue.SimpleQueue()
+            root_logger.addHandler(StructuredQueueHandler(log_queue))
+            _file_log_listener = QueueListener(
+                log_queue, file_handler, respect_handler_level=True
+            )
+            _file_log_listener.start()
+            atexit.register(_file_log_listener.stop)
     
-    # Prevent duplicate logging
-    root_logger.propagate = False
+        # Prevent duplicate logging
+        root_logger.propagate = False
     
-    # Configure third-party loggers
-    logging.getLogger("httpx").setLevel(logging.WARNING)
-    logging.getLogger("httpcore").setLevel(logging.WARNING)
-    logging.getLogger("urllib3").setLevel(logging.WARNING)
-    logging.getLogger("supabase").setLevel(logging.INFO)
+        # Configure third-party loggers
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+        logging.getLogger("httpcore").setLevel(logging.WARNING)
+        logging.getLogger("urllib3").setLevel(logging.WARNING)
+        logging.getLogger("supabase").setLevel(logging.INFO)
     
-    _logging_configured = True
+        _logging_configured = True
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -264,6 +479,13 @@ class StructuredLogger:
     def __init__(self, name: str):
         self.logger = get_logger(name)
         self._context: Dict[str, Any] = {}
+        self._context_has_correlation_keys = False
+        # Bound ContextVar getters to skip attribute lookups per log call
+        self._get_correlation_id = correlation_id_var.get
+        self._get_request_id = request_id_var.get
+        self._get_user_id = user_id_var.get
+        # Bound level check so suppressed calls return before any allocation
+        self._is_enabled_for = self.logger.isEnabledFor
     
     def _log_with_context(
         self, 
@@ -273,32 +495,47 @@ class StructuredLogger:
         exc_info: bool = False
     ) -> None:
         """Internal method to log with context"""
+        # Fast path: nothing to merge, so skip building an extra dict
+        # (correlation context is attached by ContextLogRecord)
+        if not extra:
+            if not self._context:
+                self.logger.log(level, message, exc_info=exc_info)
+                return
+            if not self._context_has_correlation_keys:
+                # makeRecord only reads extra, so the context can be shared
+                self.logger.log(
+                    level, message, extra=self._context, exc_info=exc_info
+                )
+                return
+        
         # Merge instance context with extra context
-        merged_extra = {**self._context}
-        if extra:
-            merged_extra.update(extra)
+        merged_extra = {**self._context, **extra} if extra else {**self._context}
         
-        # Add correlation context if available
-        correlation_id = correlation_id_var.get(None)
-        request_id = request_id_var.get(None)
-        if correlation_id:
-            merged_extra['correlation_id'] = correlation_id
-        if request_id:
-            merged_extra['request_id'] = request_id
+        # Active correlation context takes precedence and is already set on
+        # the record, so drop colliding keys rather than overwrite it
+        if self._get_correlation_id(None) is not None:
+            merged_extra.pop('correlation_id', None)
+        if self._get_request_id(None) is not None:
+            merged_extra.pop('request_id', None)
+        if self._get_user_id(None) is not None:
+            merged_extra.pop('user_id', None)
         
         self.logger.log(level, message, extra=merged_extra, exc_info=exc_info)
     
     def debug(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
         """Log debug message"""
-        self._log_with_context(logging.DEBUG, message, extra)
+        if self._is_enabled_for(logging.DEBUG):
+            self._log_with_context(logging.DEBUG, message, extra)
     
     def info(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
         """Log info message"""
-        self._log_with_context(logging.INFO, message, extra)
+        if self._is_enabled_for(logging.INFO):
+            self._log_with_context(logging.INFO, message, extra)
     
     def warning(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
         """Log warning message"""
-        self._log_with_context(logging.WARNING, message, extra)
+        if self._is_enabled_for(logging.WARNING):
+            self._log_with_context(logging.WARNING, message, extra)
     
     def error(
         self, 
@@ -307,7 +544,8 @@ class StructuredLogger:
         exc_info: bool = False
     ) -> None:
         """Log error message"""
-        self._log_with_context(logging.ERROR, message, extra, exc_info)
+        if self._is_enabled_for(logging.ERROR):
+            self._log_with_context(logging.ERROR, message, extra, exc_info)
     
     def critical(
         self, 
@@ -316,16 +554,22 @@ class StructuredLogger:
         exc_info: bool = False
     ) -> None:
         """Log critical message"""
-        self._log_with_context(logging.CRITICAL, message, extra, exc_info)
+        if self._is_enabled_for(logging.CRITICAL):
+            self._log_with_context(logging.CRITICAL, message, extra, exc_info)
     
     def exception(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
         """Log exception with traceback"""
-        self._log_with_context(logging.ERROR, message, extra, exc_info=True)
+        if self._is_enabled_for(logging.ERROR):
+            self._log_with_context(logging.ERROR, message, extra, exc_info=True)
     
     def with_context(self, **context) -> 'StructuredLogger':
         """Return new logger instance with additional context"""
-        new_logger = StructuredLogger(self.logger.name)
+        # Shallow copy shares the underlying logger and bound helpers
+        new_logger = copy.copy(self)
         new_logger._context = {**self._context, **context}
+        new_logger._context_has_correlation_keys = not _CORRELATION_KEYS.isdisjoint(
+            new_logger._context
+        )
         return new_logger
 
 
@@ -338,7 +582,7 @@ def correlation_context(correlation_id: Optional[str] = None):
         correlation_id: Optional correlation ID, generates one if not provided
     """
     if correlation_id is None:
-        correlation_id = f"corr_{uuid.uuid4().hex[:12]}"
+        correlation_id = f"corr_{secrets.token_hex(6)}"
     
     token = correlation_id_var.set(correlation_id)
     try:
@@ -362,16 +606,17 @@ def request_context(
         correlation_id: Optional correlation ID
     """
     if request_id is None:
-        request_id = f"req_{uuid.uuid4().hex[:12]}"
+        request_id = f"req_{secrets.token_hex(6)}"
     if correlation_id is None:
-        correlation_id = f"corr_{uuid.uuid4().hex[:12]}"
+        correlation_id = f"corr_{secrets.token_hex(6)}"
     
     # Set context variables
-    tokens = []
-    tokens.append(request_id_var.set(request_id))
-    tokens.append(correlation_id_var.set(correlation_id))
+    tokens = [
+        (request_id_var, request_id_var.set(request_id)),
+        (correlation_id_var, correlation_id_var.set(correlation_id)),
+    ]
     if user_id:
-        tokens.append(user_id_var.set(user_id))
+        tokens.append((user_id_var, user_id_var.set(user_id)))
     
     try:
         yield {
@@ -381,9 +626,8 @@ def request_context(
         }
     finally:
         # Reset all tokens
-        for token in reversed(tokens):
-            if hasattr(token, 'var'):  # Handle case where user_id token might not exist
-                token.var.reset(token)
+        for var, token in reversed(tokens):
+            var.reset(token)
 
 
 class TimedLogger:
@@ -394,10 +638,10 @@ class TimedLogger:
     def __init__(self, logger: Union[logging.Logger, StructuredLogger], operation: str):
         self.logger = logger
         self.operation = operation
-        self.start_time = None
+        self.start_ns = None
     
     def __enter__(self):
-        self.start_time = time.time()
+        self.start_ns = time.perf_counter_ns()
         if isinstance(self.logger, StructuredLogger):
             self.logger.debug(f"Starting {self.operation}")
         else:
@@ -405,7 +649,7 @@ class TimedLogger:
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        duration_ms = int((time.time() - self.start_time) * 1000)
+        duration_ms = (time.perf_counter_ns() - self.start_ns) // 1_000_000
         
         extra_context = {"operation": self.operation, "duration_ms": duration_ms}
         
@@ -422,7 +666,16 @@ class TimedLogger:
                 self.logger.error(f"Failed {self.operation} after {duration_ms}ms: {exc_val}")
 
 
+# Structured loggers interned by name, mirroring logging.getLogger
+_structured_loggers: Dict[str, StructuredLogger] = {}
+
+
 # Convenience function for backward compatibility
 def get_structured_logger(name: str) -> StructuredLogger:
-    """Get a structured logger instance"""
-    return StructuredLogger(name)
\ No newline at end of file
+    """Get the shared structured logger instance for a name"""
+    structured_logger = _structured_loggers.get(name)
+    if structured_logger is None:
+        structured_logger = _structured_loggers.setdefault(
+            name, StructuredLogger(name)
+        )
+    return structured_logger
\ No newline at end of file
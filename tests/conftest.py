@@ -0,0 +1,25 @@
+"""
+Shared pytest fixtures.
+"""
+
+import pytest
+import pytest_asyncio
+
+from tests.fixtures.call_samples import SAMPLE_FACTORIES
+
+
+@pytest.fixture(scope="session", params=list(SAMPLE_FACTORIES))
+def call_sample(request):
+    """Each sample call scenario, built once per test session"""
+    return SAMPLE_FACTORIES[request.param]()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    """Async API client bound to the app, shared by the whole test session"""
+    # Imported here so suites that never use the client don't load the app
+    import httpx
+    from app.main import app
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
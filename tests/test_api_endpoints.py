@@ -10,125 +10,190 @@ Tests cover:
 - Correlation ID tracking
 """
 
+import asyncio
+import time
+
+import orjson
 import pytest
-import pytest_asyncio
-from unittest.mock import Mock, AsyncMock, patch, MagicMock
-from fastapi.testclient import TestClient
-from fastapi import HTTPException
-from datetime import datetime
+from unittest.mock import AsyncMock, patch
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, List, Any
-from app.models.requests import EvaluateCallRequest, CallContext, TranscriptData, TranscriptMetadata
-from app.models.responses import EvaluateCallResponse, EvaluationSummary
+from app import main
+from app.api.routes import get_orchestrator, get_db_service
+from app.main import app
+from app.services.database import DatabaseService
+from app.services.orchestrator import CallQAOrchestrator
+from app.models.responses import EvaluateCallResponse
 from app.models.schemas import (
     EvaluationResult, CallClassification, ScriptAdherence, 
-    Compliance, Communication, DeepDive
+    Compliance, Communication, CallOutcome, AdherenceLevel,
+    ComplianceSummary, CommunicationSummary
 )
 
 
-class TestAPIEndpoints:
-    """Test cases for API endpoints"""
-    
-    @pytest.fixture
-    @patch('app.main.orchestrator')
-    @patch('app.main.db_service')
-    def client(self, mock_db, mock_orch):
-        """Create test client with mocked services"""
-        from app.main import app
-        return TestClient(app)
-    
-    @pytest.fixture
-    def mock_orchestrator(self):
-        """Mock orchestrator instance"""
-        orchestrator = AsyncMock()
-        orchestrator.initialized = True
-        return orchestrator
-    
-    @pytest.fixture
-    def mock_db_service(self):
-        """Mock database service instance"""
-        db_service = AsyncMock()
-        return db_service
-    
-    @pytest.fixture
-    def sample_request(self):
-        """Sample evaluation request"""
-        return {
-            "call_id": "test_call_123",
-            "agent_id": "agent_456", 
-            "call_context": "inbound_sales",
-            "transcript": {
-                "data": [
-                    {"speaker": "Agent", "text": "Hello, how can I help you today?", "timestamp": 0.0},
-                    {"speaker": "Customer", "text": "I'm interested in your loan products.", "timestamp": 5.0}
-                ],
-                "metadata": {
-                    "duration_seconds": 300,
-                    "call_date": "2024-01-15T10:30:00Z"
-                }
-            }
+# Batch size for the large-batch test, above the default concurrency limit
+LARGE_BATCH_SIZE = 50
+
+# Call/agent ID pairs for every batch the tests build, formatted once
+_BATCH_IDS = [(f"test_call_{i}", f"agent_{i}") for i in range(LARGE_BATCH_SIZE)]
+
+
+# Valid evaluation request shared by the single-call and batch payloads.
+# Per-call IDs are spread over it; the nested sections are never mutated.
+CALL_TEMPLATE = MappingProxyType({
+    "call_context": "First Call",
+    "transcript": {
+        "transcript": "Agent: Hello, how can I help you today?\nClient: I'm interested in your loan products.",
+        "metadata": {
+            "duration": 300,
+            "timestamp": "2024-01-15T10:30:00Z",
+            "talk_time": 280,
+            "disposition": "completed"
         }
-    
-    @pytest.fixture
-    def sample_evaluation_result(self):
-        """Sample evaluation result from orchestrator"""
-        return EvaluationResult(
-            classification=CallClassification(
-                sections_completed=[1, 2, 3],
-                sections_attempted=[1, 2, 3],
-                call_outcome="completed",
-                script_adherence_preview={"introduction": "high", "needs_assessment": "medium"},
-                red_flags=[],
-                requires_deep_dive=False,
-                early_termination_justified=False
-            ),
-            script_deviation=ScriptAdherence(sections={}),
-            compliance=Compliance(items=[], summary={"no_infraction": [], "coaching_needed": [], "violations": [], "not_applicable": []}),
-            communication=Communication(skills=[], summary={"exceeded": ["rapport"], "met": ["clarity"], "missed": []}),
-            deep_dive=None
-        )
-    
-    @pytest.fixture
-    def sample_summary(self):
-        """Sample evaluation summary"""
-        return {
-            "strengths": ["Excellent rapport building"],
-            "areas_for_improvement": ["Could improve closing technique"],
-            "critical_issues": []
+    },
+    "ideal_script": "Section 1: Introduction and greeting",
+    "client_data": {
+        "script_progress": {
+            "sections_attempted": [1, 2, 3],
+            "last_completed_section": 3,
+            "termination_reason": "completed"
         }
+    }
+})
+
+
+def create_batch_request(count: int = 3) -> List[Dict[str, Any]]:
+    """Batch of calls that differ only in their IDs"""
+    return [
+        {**CALL_TEMPLATE, "call_id": call_id, "agent_id": agent_id}
+        for call_id, agent_id in _BATCH_IDS[:count]
+    ]
+
+
+@lru_cache(maxsize=None)
+def encode_batch_request(count: int = 3) -> bytes:
+    """JSON body for a batch of `count` calls, encoded once per size"""
+    return orjson.dumps(create_batch_request(count))
+
+
+# Request bodies below are pre-encoded, so they are posted with an explicit content type
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+@pytest.fixture(scope="session")
+def sample_request():
+    """Sample evaluation request"""
+    return {**CALL_TEMPLATE, "call_id": "test_call_123", "agent_id": "agent_456"}
+
+
+@pytest.fixture(scope="session")
+def sample_request_bytes(sample_request):
+    """Sample evaluation request, JSON-encoded once"""
+    return orjson.dumps(sample_request)
+
+
+# Sample evaluation result returned by the mocked orchestrator. The values are
+# known-valid, so the models are built without validation; tests only read it.
+SAMPLE_EVALUATION_RESULT = EvaluationResult.model_construct(
+    classification=CallClassification.model_construct(
+        sections_completed=[1, 2, 3],
+        sections_attempted=[1, 2, 3],
+        call_outcome=CallOutcome.COMPLETED,
+        script_adherence_preview={"introduction": AdherenceLevel.HIGH, "needs_assessment": AdherenceLevel.MEDIUM},
+        red_flags=[],
+        requires_deep_dive=False,
+        early_termination_justified=False
+    ),
+    script_deviation=ScriptAdherence.model_construct(sections={}),
+    compliance=Compliance.model_construct(items=[], summary=ComplianceSummary.model_construct(no_infraction=[], coaching_needed=[], violations=[], not_applicable=[])),
+    communication=Communication.model_construct(skills=[], summary=CommunicationSummary.model_construct(exceeded=["rapport"], met=["clarity"], missed=[])),
+    deep_dive=None
+)
+
+# The same result as it appears in a JSON response body
+SAMPLE_EVALUATION_JSON = SAMPLE_EVALUATION_RESULT.model_dump(mode="json")
+
+
+@pytest.fixture(scope="session")
+def sample_evaluation_result():
+    """Sample evaluation result from orchestrator"""
+    return SAMPLE_EVALUATION_RESULT
+
+
+@pytest.fixture(scope="session")
+def sample_summary():
+    """Sample evaluation summary"""
+    return {
+        "strengths": ["Excellent rapport building"],
+        "areas_for_improvement": ["Could improve closing technique"],
+        "critical_issues": []
+    }
+
+
+@pytest.fixture(scope="session")
+def auth_headers():
+    """Authentication headers"""
+    return {**JSON_HEADERS, "Authorization": "Bearer test_api_key"}
+
+
+@pytest.fixture(scope="session")
+def mock_orchestrator():
+    """Mock orchestrator instance, reset before each test"""
+    # The spec keeps the scoring and summary helpers synchronous, like the real ones
+    orchestrator = AsyncMock(spec=CallQAOrchestrator)
+    orchestrator.initialized = True
+    return orchestrator
+
+
+@pytest.fixture(scope="session")
+def mock_db_service():
+    """Mock database service instance, reset before each test"""
+    return AsyncMock(spec=DatabaseService)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def internal_api_key():
+    """Configure the API key the auth dependency checks against"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("INTERNAL_API_KEY", "test_api_key")
+        yield
+
+
+class TestAPIEndpoints:
+    """Test cases for API endpoints"""
     
-    @pytest.fixture
-    def auth_headers(self):
-        """Authentication headers"""
-        return {"Authorization": "Bearer test_api_key"}
+    @pytest.fixture(autouse=True)
+    def override_services(self, mock_orchestrator, mock_db_service,
+                          sample_evaluation_result, sample_summary):
+        """Route the service dependencies to the shared mocks for one test"""
+        # Each xdist worker imports its own app, so these overrides never cross workers
+        mock_orchestrator.reset_mock(return_value=True, side_effect=True)
+        mock_db_service.reset_mock(return_value=True, side_effect=True)
+        # Default to a successful evaluation; tests override what they exercise
+        mock_orchestrator.evaluate_call.return_value = sample_evaluation_result
+        mock_orchestrator.calculate_overall_score.return_value = 85
+        mock_orchestrator.generate_summary.return_value = sample_summary
+        app.dependency_overrides[get_orchestrator] = lambda: mock_orchestrator
+        app.dependency_overrides[get_db_service] = lambda: mock_db_service
+        yield
+        app.dependency_overrides.clear()
 
 
 class TestSingleCallEvaluation(TestAPIEndpoints):
     """Tests for single call evaluation endpoint"""
     
-    @patch.dict('os.environ', {'INTERNAL_API_KEY': 'test_api_key'})
-    @patch('app.api.routes.get_orchestrator')
-    @patch('app.api.routes.get_db_service')
-    def test_evaluate_call_success(self, mock_get_db, mock_get_orch, client, auth_headers, 
-                                  sample_request, sample_evaluation_result, sample_summary):
+    async def test_evaluate_call_success(self, mock_orchestrator, mock_db_service, client,
+                                         auth_headers, sample_request_bytes):
         """Test successful call evaluation"""
-        # Setup mocks
-        mock_orchestrator = AsyncMock()
-        mock_orchestrator.evaluate_call.return_value = sample_evaluation_result
-        mock_orchestrator.calculate_overall_score.return_value = 85
-        mock_orchestrator.generate_summary.return_value = sample_summary
-        mock_get_orch.return_value = mock_orchestrator
-        
-        mock_db_service = AsyncMock()
-        mock_get_db.return_value = mock_db_service
-        
         # Make request
-        response = client.post("/api/v1/evaluate-call", 
-                              json=sample_request, 
+        response = await client.post("/api/v1/evaluate-call", 
+                              content=sample_request_bytes, 
                               headers=auth_headers)
         
         # Assertions
         assert response.status_code == 200
-        data = response.json()
+        data = orjson.loads(response.content)
         
         assert data["call_id"] == "test_call_123"
         assert "correlation_id" in data
@@ -136,7 +201,7 @@ class TestSingleCallEvaluation(TestAPIEndpoints):
         assert data["overall_score"] == 85
         assert "processing_time_ms" in data
         assert data["summary"]["strengths"] == ["Excellent rapport building"]
-        assert "evaluation" in data
+        assert data["evaluation"] == SAMPLE_EVALUATION_JSON
         
         # Verify orchestrator was called
         mock_orchestrator.evaluate_call.assert_called_once()
@@ -146,304 +211,236 @@ class TestSingleCallEvaluation(TestAPIEndpoints):
         # Verify database storage was attempted
         mock_db_service.store_evaluation_result.assert_called_once()
     
-    @patch.dict('os.environ', {'INTERNAL_API_KEY': 'test_api_key'})
-    def test_evaluate_call_no_auth(self, client, sample_request):
-        """Test call evaluation without authentication"""
-        response = client.post("/api/v1/evaluate-call", json=sample_request)
-        assert response.status_code == 403
-    
-    @patch.dict('os.environ', {'INTERNAL_API_KEY': 'test_api_key'})
-    def test_evaluate_call_wrong_auth(self, client, sample_request):
-        """Test call evaluation with wrong API key"""
-        headers = {"Authorization": "Bearer wrong_key"}
-        response = client.post("/api/v1/evaluate-call", 
-                              json=sample_request, 
-                              headers=headers)
-        assert response.status_code == 401
-    
-    @patch.dict('os.environ', {'INTERNAL_API_KEY': 'test_api_key'})
-    @patch('app.api.routes.get_orchestrator')
-    @patch('app.api.routes.get_db_service')
-    def test_evaluate_call_orchestrator_error(self, mock_get_db, mock_get_orch, 
-                                            client, auth_headers, sample_request):
+    async def test_evaluate_call_orchestrator_error(self, mock_orchestrator, 
+                                            client, auth_headers, sample_request_bytes):
         """Test evaluation when orchestrator raises error"""
         # Setup mocks
-        mock_orchestrator = AsyncMock()
         mock_orchestrator.evaluate_call.side_effect = Exception("Orchestrator error")
-        mock_get_orch.return_value = mock_orchestrator
-        
-        mock_db_service = AsyncMock()
-        mock_get_db.return_value = mock_db_service
         
         # Make request
-        response = client.post("/api/v1/evaluate-call", 
-                              json=sample_request, 
+        response = await client.post("/api/v1/evaluate-call", 
+                              content=sample_request_bytes, 
                               headers=auth_headers)
         
         # Assertions
         assert response.status_code == 500
-        data = response.json()
-        assert data["detail"]["error"] == "EVALUATION_FAILED"
-        assert "correlation_id" in data["detail"]
-    
-    @patch.dict('os.environ', {'INTERNAL_API_KEY': 'test_api_key'})
-    def test_evaluate_call_invalid_request(self, client, auth_headers):
-        """Test evaluation with invalid request data"""
-        invalid_request = {"call_id": "test", "missing_required_fields": True}
-        
-        response = client.post("/api/v1/evaluate-call", 
-                              json=invalid_request, 
-                              headers=auth_headers)
-        
-        assert response.status_code == 422  # Validation error
+        assert b'"EVALUATION_FAILED"' in response.content
+        assert b'"correlation_id"' in response.content
 
 
 class TestBatchEvaluation(TestAPIEndpoints):
     """Tests for batch evaluation endpoint"""
     
-    def create_batch_request(self, count=3):
-        """Helper to create batch request"""
-        requests = []
-        for i in range(count):
-            requests.append({
-                "call_id": f"test_call_{i}",
-                "agent_id": f"agent_{i}",
-                "call_context": "inbound_sales",
-                "transcript": {
-                    "data": [
-                        {"speaker": "Agent", "text": f"Hello {i}", "timestamp": 0.0},
-                        {"speaker": "Customer", "text": f"Response {i}", "timestamp": 5.0}
-                    ],
-                    "metadata": {
-                        "duration_seconds": 300,
-                        "call_date": "2024-01-15T10:30:00Z"
-                    }
-                }
-            })
-        return requests
-    
-    @patch.dict('os.environ', {'INTERNAL_API_KEY': 'test_api_key'})
-    @patch('app.api.routes.get_orchestrator')
-    @patch('app.api.routes.get_db_service')
-    def test_evaluate_batch_success(self, mock_get_db, mock_get_orch, client, auth_headers, 
-                                   sample_evaluation_result, sample_summary):
-        """Test successful batch evaluation"""
-        # Setup mocks
-        mock_orchestrator = AsyncMock()
-        mock_orchestrator.evaluate_call.return_value = sample_evaluation_result
-        mock_orchestrator.calculate_overall_score.return_value = 85
-        mock_orchestrator.generate_summary.return_value = sample_summary
-        mock_get_orch.return_value = mock_orchestrator
-        
-        mock_db_service = AsyncMock()
-        mock_get_db.return_value = mock_db_service
+    async def test_evaluate_batch_mixed_outcomes(self, mock_orchestrator, client, auth_headers,
+                                                 sample_evaluation_result):
+        """Test one batch that skips, evaluates and fails calls"""
+        short_call = {
+            **CALL_TEMPLATE,
+            "call_id": "short_batch_1",
+            "agent_id": "agent_456",
+            "transcript": {
+                **CALL_TEMPLATE["transcript"],
+                "metadata": {**CALL_TEMPLATE["transcript"]["metadata"], "talk_time": 35}
+            }
+        }
+        batch_request = [short_call, *create_batch_request(3)]
         
-        # Create batch request
-        batch_request = self.create_batch_request(count=2)
+        # The short call is skipped, so only test_call_0..2 reach the orchestrator, in order
+        mock_orchestrator.evaluate_call.side_effect = [
+            sample_evaluation_result,
+            Exception("Second call failed"),
+            sample_evaluation_result
+        ]
         
-        # Make request
-        response = client.post("/api/v1/evaluate-batch", 
-                              json=batch_request, 
+        response = await client.post("/api/v1/evaluate-batch", 
+                              content=orjson.dumps(batch_request), 
                               headers=auth_headers)
         
         # Assertions
         assert response.status_code == 200
-        data = response.json()
+        data = orjson.loads(response.content)
         
         assert "batch_correlation_id" in data
         assert data["batch_correlation_id"].startswith("batch_")
-        assert len(data["results"]) == 2
-        assert data["summary"]["total"] == 2
-        assert data["summary"]["successful"] == 2
-        assert data["summary"]["failed"] == 0
-        assert data["summary"]["success_rate"] == 1.0
+        assert data["summary"]["total"] == 4
+        assert data["summary"]["successful"] == 3
+        assert data["summary"]["failed"] == 1
+        assert data["summary"]["success_rate"] == 0.75
+        
+        results = {r["call_id"]: r for r in data["results"]}
         
-        # Verify all calls were processed
-        for result in data["results"]:
-            assert result["success"] is True
-            assert "response" in result
+        skipped = results["short_batch_1"]
+        assert skipped["success"] is True
+        assert skipped["skipped"] is True
+        assert skipped["response"]["status"] == "skipped"
+        
+        for call_id in ("test_call_0", "test_call_2"):
+            assert results[call_id]["success"] is True
+            assert not results[call_id].get("skipped")
+            assert "evaluation" in results[call_id]["response"]
+        
+        assert results["test_call_1"]["success"] is False
+        assert "error" in results["test_call_1"]
+        
+        assert mock_orchestrator.evaluate_call.call_count == 3
     
-    @patch.dict('os.environ', {'INTERNAL_API_KEY': 'test_api_key'})
-    def test_evaluate_batch_empty(self, client, auth_headers):
-        """Test batch evaluation with empty list"""
-        response = client.post("/api/v1/evaluate-batch", 
-                              json=[], 
+    @patch('app.config.settings.max_concurrent_evaluations', LARGE_BATCH_SIZE)
+    async def test_evaluate_batch_large(self, mock_orchestrator, client, auth_headers):
+        """Test that a large batch is parsed as one list and every call is evaluated"""
+        response = await client.post("/api/v1/evaluate-batch", 
+                              content=encode_batch_request(LARGE_BATCH_SIZE), 
                               headers=auth_headers)
         
-        assert response.status_code == 400
-        data = response.json()
-        assert data["detail"]["error"] == "EMPTY_BATCH"
+        assert response.status_code == 200
+        data = orjson.loads(response.content)
+        assert len(data["results"]) == LARGE_BATCH_SIZE
+        assert data["summary"]["total"] == LARGE_BATCH_SIZE
+        assert {r["call_id"] for r in data["results"]} == {call_id for call_id, _ in _BATCH_IDS}
+        assert mock_orchestrator.evaluate_call.call_count == LARGE_BATCH_SIZE
     
-    @patch.dict('os.environ', {'INTERNAL_API_KEY': 'test_api_key'})
     @patch('app.config.settings.max_concurrent_evaluations', 2)
-    def test_evaluate_batch_size_exceeded(self, client, auth_headers):
+    async def test_evaluate_batch_size_exceeded(self, client, auth_headers):
         """Test batch evaluation when size limit exceeded"""
-        batch_request = self.create_batch_request(count=5)  # Exceeds limit of 2
+        batch_body = encode_batch_request(5)  # Exceeds limit of 2
         
-        response = client.post("/api/v1/evaluate-batch", 
-                              json=batch_request, 
+        response = await client.post("/api/v1/evaluate-batch", 
+                              content=batch_body, 
                               headers=auth_headers)
         
         assert response.status_code == 400
-        data = response.json()
-        assert data["detail"]["error"] == "BATCH_SIZE_EXCEEDED"
+        assert b'"BATCH_SIZE_EXCEEDED"' in response.content
     
-    @patch.dict('os.environ', {'INTERNAL_API_KEY': 'test_api_key'})
-    @patch('app.api.routes.get_orchestrator')
-    @patch('app.api.routes.get_db_service')  
-    def test_evaluate_batch_partial_failure(self, mock_get_db, mock_get_orch, client, auth_headers,
-                                           sample_evaluation_result, sample_summary):
-        """Test batch evaluation with some failures"""
-        # Setup mocks - first call succeeds, second fails
-        mock_orchestrator = AsyncMock()
-        call_count = 0
-        
-        async def mock_evaluate_call(request):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                return sample_evaluation_result
-            else:
-                raise Exception("Second call failed")
-        
-        mock_orchestrator.evaluate_call.side_effect = mock_evaluate_call
-        mock_orchestrator.calculate_overall_score.return_value = 85
-        mock_orchestrator.generate_summary.return_value = sample_summary
-        mock_get_orch.return_value = mock_orchestrator
-        
-        mock_db_service = AsyncMock()
-        mock_get_db.return_value = mock_db_service
-        
-        # Create batch request
-        batch_request = self.create_batch_request(count=2)
-        
-        # Make request
-        response = client.post("/api/v1/evaluate-batch", 
-                              json=batch_request, 
-                              headers=auth_headers)
-        
-        # Assertions
-        assert response.status_code == 200
-        data = response.json()
-        
-        assert data["summary"]["total"] == 2
-        assert data["summary"]["successful"] == 1
-        assert data["summary"]["failed"] == 1
-        assert data["summary"]["success_rate"] == 0.5
-        
-        # Check individual results
-        success_results = [r for r in data["results"] if r["success"]]
-        failure_results = [r for r in data["results"] if not r["success"]]
-        
-        assert len(success_results) == 1
-        assert len(failure_results) == 1
-        assert "error" in failure_results[0]
+class TestRequestRejection(TestAPIEndpoints):
+    """Tests for requests rejected by authentication or validation"""
     
-    @patch.dict('os.environ', {'INTERNAL_API_KEY': 'test_api_key'})
-    def test_evaluate_batch_no_auth(self, client):
-        """Test batch evaluation without authentication"""
-        batch_request = self.create_batch_request(count=1)
-        response = client.post("/api/v1/evaluate-batch", json=batch_request)
-        assert response.status_code == 403
+    @pytest.mark.parametrize("path,body,api_key,expected_status,expected_error", [
+        pytest.param("/api/v1/evaluate-call", orjson.dumps(create_batch_request(1)[0]), None, 403, None,
+                     id="call_no_auth"),
+        pytest.param("/api/v1/evaluate-call", orjson.dumps(create_batch_request(1)[0]), "wrong_key", 401, None,
+                     id="call_wrong_auth"),
+        pytest.param("/api/v1/evaluate-batch", encode_batch_request(1), None, 403, None,
+                     id="batch_no_auth"),
+        pytest.param("/api/v1/evaluate-batch", b"[]", "test_api_key", 400, "EMPTY_BATCH",
+                     id="batch_empty"),
+        pytest.param("/api/v1/evaluate-call", b'{"call_id": "test", "missing_required_fields": true}',
+                     "test_api_key", 422, None, id="call_invalid_request"),
+    ])
+    async def test_request_rejected(self, client, path, body, api_key, expected_status, expected_error):
+        """Test that unauthenticated or invalid requests are rejected"""
+        headers = {**JSON_HEADERS, "Authorization": f"Bearer {api_key}"} if api_key else JSON_HEADERS
+        response = await client.post(path, content=body, headers=headers)
+        
+        assert response.status_code == expected_status
+        if expected_error:
+            assert f'"{expected_error}"'.encode() in response.content
 
 
 class TestErrorHandling(TestAPIEndpoints):
     """Tests for error handling scenarios"""
     
-    @patch.dict('os.environ', {'INTERNAL_API_KEY': 'test_api_key'})
-    @patch('app.api.routes.get_orchestrator')
-    @patch('app.api.routes.get_db_service')
-    def test_database_storage_error_handled(self, mock_get_db, mock_get_orch, 
-                                          client, auth_headers, sample_request,
-                                          sample_evaluation_result, sample_summary):
+    async def test_database_storage_error_handled(self, mock_db_service, client, auth_headers,
+                                                  sample_request_bytes):
         """Test that database storage errors don't fail the request"""
-        # Setup mocks
-        mock_orchestrator = AsyncMock()
-        mock_orchestrator.evaluate_call.return_value = sample_evaluation_result
-        mock_orchestrator.calculate_overall_score.return_value = 85
-        mock_orchestrator.generate_summary.return_value = sample_summary
-        mock_get_orch.return_value = mock_orchestrator
-        
         # Database service raises error but request should still succeed
-        mock_db_service = AsyncMock()
         mock_db_service.store_evaluation_result.side_effect = Exception("DB error")
-        mock_get_db.return_value = mock_db_service
         
         # Make request
-        response = client.post("/api/v1/evaluate-call", 
-                              json=sample_request, 
+        response = await client.post("/api/v1/evaluate-call", 
+                              content=sample_request_bytes, 
                               headers=auth_headers)
         
         # Should still succeed despite DB error
         assert response.status_code == 200
-        data = response.json()
-        assert data["call_id"] == "test_call_123"
+        assert b'"test_call_123"' in response.content
 
 
 class TestResponseValidation(TestAPIEndpoints):
     """Tests for response format validation"""
     
-    @patch.dict('os.environ', {'INTERNAL_API_KEY': 'test_api_key'})
-    @patch('app.api.routes.get_orchestrator')
-    @patch('app.api.routes.get_db_service')
-    def test_response_format_compliance(self, mock_get_db, mock_get_orch, 
-                                       client, auth_headers, sample_request,
-                                       sample_evaluation_result, sample_summary):
+    async def test_response_format_compliance(self, client, auth_headers, sample_request_bytes):
         """Test that response format matches specification"""
-        # Setup mocks
-        mock_orchestrator = AsyncMock()
-        mock_orchestrator.evaluate_call.return_value = sample_evaluation_result
-        mock_orchestrator.calculate_overall_score.return_value = 85
-        mock_orchestrator.generate_summary.return_value = sample_summary
-        mock_get_orch.return_value = mock_orchestrator
-        
-        mock_db_service = AsyncMock()
-        mock_get_db.return_value = mock_db_service
-        
         # Make request
-        response = client.post("/api/v1/evaluate-call", 
-                              json=sample_request, 
+        response = await client.post("/api/v1/evaluate-call", 
+                              content=sample_request_bytes, 
                               headers=auth_headers)
         
-        # Validate response structure
+        # Validate response structure against the response model in one strict
+        # pass; it covers required fields, types and the overall_score range
         assert response.status_code == 200
-        data = response.json()
-        
-        # Required fields
-        required_fields = [
-            "call_id", "correlation_id", "timestamp", 
-            "processing_time_ms", "evaluation", "overall_score", "summary"
-        ]
+        parsed = EvaluateCallResponse.model_validate_json(response.content, strict=True)
         
-        for field in required_fields:
-            assert field in data, f"Missing required field: {field}"
-        
-        # Validate field types
-        assert isinstance(data["overall_score"], int)
-        assert 1 <= data["overall_score"] <= 100
-        assert isinstance(data["processing_time_ms"], int)
-        assert data["processing_time_ms"] >= 0
+        assert parsed.processing_time_ms >= 0
         
         # Validate correlation ID format
-        assert data["correlation_id"].startswith("eval_")
-        
-        # Validate summary structure
-        summary = data["summary"]
-        assert "strengths" in summary
-        assert "areas_for_improvement" in summary  
-        assert "critical_issues" in summary
-        assert isinstance(summary["strengths"], list)
-        assert isinstance(summary["areas_for_improvement"], list)
-        assert isinstance(summary["critical_issues"], list)
+        assert parsed.correlation_id.startswith("eval_")
+        
+        # The summary lists have defaults, so check they were actually sent
+        assert parsed.summary.model_fields_set == {"strengths", "areas_for_improvement", "critical_issues"}
+
+
+class TestHealthEndpoint:
+    """Tests for the /health database probe and its breaker"""
+
+    @pytest.fixture(autouse=True)
+    def health_state(self, monkeypatch):
+        """Start each test with a ready orchestrator and a closed breaker"""
+        monkeypatch.setattr(main.orchestrator, "initialized", True)
+        monkeypatch.setattr(main, "DB_HEALTH_PROBE_TIMEOUT_SECONDS", 0.05)
+        monkeypatch.setattr(main, "_db_health_breaker_until", 0.0)
+
+    @staticmethod
+    def slow_health_check():
+        """Database health check that outlasts the probe timeout"""
+        async def health_check():
+            await asyncio.sleep(1)
+            return True
+
+        return AsyncMock(side_effect=health_check)
+
+    async def test_probe_timeout_reports_degraded(self, client):
+        """Test a database probe timeout returns 503 with the database unhealthy"""
+        with patch.object(main.db_service, 'health_check', new=self.slow_health_check()):
+            response = await client.get("/health")
+
+        assert response.status_code == 503
+        health = orjson.loads(response.content)
+        assert health["status"] == "degraded"
+        assert health["dependencies"]["database"] == "unhealthy"
+
+    async def test_breaker_skips_database_after_timeout(self, client):
+        """Test calls within DB_HEALTH_BREAKER_SECONDS of a timeout skip the probe"""
+        with patch.object(
+            main.db_service, 'health_check', new=self.slow_health_check()
+        ) as mock_health_check:
+            await client.get("/health")
+            response = await client.get("/health")
+
+        assert response.status_code == 503
+        assert mock_health_check.await_count == 1
+
+    async def test_probe_runs_again_after_breaker_window(self, client, monkeypatch):
+        """Test the database is probed again once the breaker window has passed"""
+        with patch.object(main.db_service, 'health_check', new=self.slow_health_check()):
+            await client.get("/health")
+
+        # Move the breaker deadline into the past instead of sleeping through it
+        assert main._db_health_breaker_until > time.monotonic()
+        monkeypatch.setattr(main, "_db_health_breaker_until", time.monotonic() - 1)
+
+        with patch.object(
+            main.db_service, 'health_check', new=AsyncMock(return_value=True)
+        ) as mock_health_check:
+            response = await client.get("/health")
+
+        mock_health_check.assert_awaited_once()
+        assert response.status_code == 200
+        assert orjson.loads(response.content)["status"] == "healthy"
 
 
 class TestTalkTimeFiltering(TestAPIEndpoints):
     """Tests for talk_time filtering logic"""
 
-    @patch.dict('os.environ', {'INTERNAL_API_KEY': 'test_api_key'})
-    @patch('app.api.routes.get_orchestrator')
-    @patch('app.api.routes.get_db_service')
-    def test_skip_call_with_short_talk_time(self, mock_get_db, mock_get_orch,
+    async def test_skip_call_with_short_talk_time(self, mock_orchestrator,
                                            client, auth_headers):
         """Test that calls with talk_time < 60 are skipped"""
         # Create request with short talk_time
@@ -470,20 +467,14 @@ class TestTalkTimeFiltering(TestAPIEndpoints):
             }
         }
 
-        # Setup mocks (should NOT be called)
-        mock_orchestrator = AsyncMock()
-        mock_get_orch.return_value = mock_orchestrator
-        mock_db_service = AsyncMock()
-        mock_get_db.return_value = mock_db_service
-
         # Make request
-        response = client.post("/api/v1/evaluate-call",
-                              json=short_call_request,
+        response = await client.post("/api/v1/evaluate-call",
+                              content=orjson.dumps(short_call_request),
                               headers=auth_headers)
 
         # Assertions
         assert response.status_code == 200
-        data = response.json()
+        data = orjson.loads(response.content)
 
         # Verify skipped response structure
         assert data["status"] == "skipped"
@@ -499,12 +490,8 @@ class TestTalkTimeFiltering(TestAPIEndpoints):
         mock_orchestrator.calculate_overall_score.assert_not_called()
         mock_orchestrator.generate_summary.assert_not_called()
 
-    @patch.dict('os.environ', {'INTERNAL_API_KEY': 'test_api_key'})
-    @patch('app.api.routes.get_orchestrator')
-    @patch('app.api.routes.get_db_service')
-    def test_process_call_with_sufficient_talk_time(self, mock_get_db, mock_get_orch,
-                                                    client, auth_headers,
-                                                    sample_evaluation_result, sample_summary):
+    async def test_process_call_with_sufficient_talk_time(self, mock_orchestrator, client,
+                                                          auth_headers):
         """Test that calls with talk_time >= 60 are processed normally"""
         # Create request with sufficient talk_time
         good_call_request = {
@@ -530,24 +517,15 @@ class TestTalkTimeFiltering(TestAPIEndpoints):
             }
         }
 
-        # Setup mocks
-        mock_orchestrator = AsyncMock()
-        mock_orchestrator.evaluate_call.return_value = sample_evaluation_result
-        mock_orchestrator.calculate_overall_score.return_value = 85
-        mock_orchestrator.generate_summary.return_value = sample_summary
-        mock_get_orch.return_value = mock_orchestrator
-
-        mock_db_service = AsyncMock()
-        mock_get_db.return_value = mock_db_service
 
         # Make request
-        response = client.post("/api/v1/evaluate-call",
-                              json=good_call_request,
+        response = await client.post("/api/v1/evaluate-call",
+                              content=orjson.dumps(good_call_request),
                               headers=auth_headers)
 
         # Assertions
         assert response.status_code == 200
-        data = response.json()
+        data = orjson.loads(response.content)
 
         # Verify normal evaluation response (not skipped)
         assert "evaluation" in data
@@ -560,12 +538,7 @@ class TestTalkTimeFiltering(TestAPIEndpoints):
         mock_orchestrator.calculate_overall_score.assert_called_once()
         mock_orchestrator.generate_summary.assert_called_once()
 
-    @patch.dict('os.environ', {'INTERNAL_API_KEY': 'test_api_key'})
-    @patch('app.api.routes.get_orchestrator')
-    @patch('app.api.routes.get_db_service')
-    def test_process_call_with_no_talk_time(self, mock_get_db, mock_get_orch,
-                                           client, auth_headers,
-                                           sample_evaluation_result, sample_summary):
+    async def test_process_call_with_no_talk_time(self, mock_orchestrator, client, auth_headers):
         """Test that calls without talk_time field are processed normally"""
         # Create request without talk_time
         no_talk_time_request = {
@@ -590,24 +563,15 @@ class TestTalkTimeFiltering(TestAPIEndpoints):
             }
         }
 
-        # Setup mocks
-        mock_orchestrator = AsyncMock()
-        mock_orchestrator.evaluate_call.return_value = sample_evaluation_result
-        mock_orchestrator.calculate_overall_score.return_value = 85
-        mock_orchestrator.generate_summary.return_value = sample_summary
-        mock_get_orch.return_value = mock_orchestrator
-
-        mock_db_service = AsyncMock()
-        mock_get_db.return_value = mock_db_service
 
         # Make request
-        response = client.post("/api/v1/evaluate-call",
-                              json=no_talk_time_request,
+        response = await client.post("/api/v1/evaluate-call",
+                              content=orjson.dumps(no_talk_time_request),
                               headers=auth_headers)
 
         # Assertions
         assert response.status_code == 200
-        data = response.json()
+        data = orjson.loads(response.content)
 
         # Verify normal evaluation (not skipped when talk_time is None)
         assert "evaluation" in data
@@ -615,95 +579,3 @@ class TestTalkTimeFiltering(TestAPIEndpoints):
 
         # Verify orchestrator WAS called
         mock_orchestrator.evaluate_call.assert_called_once()
-
-    @patch.dict('os.environ', {'INTERNAL_API_KEY': 'test_api_key'})
-    @patch('app.api.routes.get_orchestrator')
-    @patch('app.api.routes.get_db_service')
-    def test_batch_with_mixed_talk_times(self, mock_get_db, mock_get_orch,
-                                        client, auth_headers,
-                                        sample_evaluation_result, sample_summary):
-        """Test batch evaluation with mix of short and sufficient talk times"""
-        batch_request = [
-            {  # Short talk_time - should be skipped
-                "call_id": "short_batch_1",
-                "agent_id": "agent_456",
-                "call_context": "First Call",
-                "transcript": {
-                    "transcript": "Short call",
-                    "metadata": {
-                        "duration": 40,
-                        "timestamp": "2024-01-15T10:30:00Z",
-                        "talk_time": 35,
-                        "disposition": "not_interested"
-                    }
-                },
-                "ideal_script": "Script",
-                "client_data": {
-                    "script_progress": {
-                        "sections_attempted": [1],
-                        "last_completed_section": 0,
-                        "termination_reason": "not_interested"
-                    }
-                }
-            },
-            {  # Sufficient talk_time - should be processed
-                "call_id": "good_batch_1",
-                "agent_id": "agent_456",
-                "call_context": "First Call",
-                "transcript": {
-                    "transcript": "Good call",
-                    "metadata": {
-                        "duration": 100,
-                        "timestamp": "2024-01-15T10:30:00Z",
-                        "talk_time": 95,
-                        "disposition": "completed"
-                    }
-                },
-                "ideal_script": "Script",
-                "client_data": {
-                    "script_progress": {
-                        "sections_attempted": [1, 2, 3],
-                        "last_completed_section": 3,
-                        "termination_reason": "completed"
-                    }
-                }
-            }
-        ]
-
-        # Setup mocks
-        mock_orchestrator = AsyncMock()
-        mock_orchestrator.evaluate_call.return_value = sample_evaluation_result
-        mock_orchestrator.calculate_overall_score.return_value = 85
-        mock_orchestrator.generate_summary.return_value = sample_summary
-        mock_get_orch.return_value = mock_orchestrator
-
-        mock_db_service = AsyncMock()
-        mock_get_db.return_value = mock_db_service
-
-        # Make request
-        response = client.post("/api/v1/evaluate-batch",
-                              json=batch_request,
-                              headers=auth_headers)
-
-        # Assertions
-        assert response.status_code == 200
-        data = response.json()
-
-        assert len(data["results"]) == 2
-        assert data["summary"]["total"] == 2
-        assert data["summary"]["successful"] == 2
-
-        # Check first result is skipped
-        result1 = next(r for r in data["results"] if r["call_id"] == "short_batch_1")
-        assert result1["success"] is True
-        assert result1.get("skipped") is True
-        assert result1["response"]["status"] == "skipped"
-
-        # Check second result is evaluated
-        result2 = next(r for r in data["results"] if r["call_id"] == "good_batch_1")
-        assert result2["success"] is True
-        assert result2.get("skipped") is None or result2.get("skipped") is False
-        assert "evaluation" in result2["response"]
-
-        # Verify orchestrator was called only once (for the good call)
-        assert mock_orchestrator.evaluate_call.call_count == 1
\ No newline at end of file
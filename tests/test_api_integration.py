@@ -176,6 +176,11 @@ class TestValidationLogic:
         assert batch_correlation_id.startswith("batch_")
         assert len(correlation_id) > 10  # Should have uuid part
         print("✓ Correlation ID generation test passed")
+    
+    def test_call_samples_pass_talk_time_threshold(self, call_sample):
+        """Test that every sample call is long enough to be evaluated"""
+        # Mirrors the 60 second skip threshold in the evaluate endpoints
+        assert call_sample.transcript.metadata.talk_time >= 60
 
 
 if __name__ == "__main__":
@@ -0,0 +1,174 @@
+"""
+Unit tests for the database service.
+
+Tests cover:
+- Batched API request logging and its background flush task
+- Flushing and closing with pending log rows
+- Health check result caching
+"""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+from unittest.mock import AsyncMock, patch
+
+from app.services.database import (
+    HEALTH_CHECK_TTL_SECONDS, DatabaseService, _InMemoryClient
+)
+
+
+API_LOGS_TABLE = "eavesly_api_logs"
+
+
+@pytest_asyncio.fixture
+async def db_service(monkeypatch):
+    """DatabaseService backed by the in-memory client"""
+    monkeypatch.setenv("SUPABASE_URL", "https://test.supabase.co")
+    monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "test_service_role_key")
+
+    with patch("app.services.database.settings") as mock_settings:
+        mock_settings.is_test.return_value = True
+        service = DatabaseService()
+
+    assert isinstance(service.client, _InMemoryClient)
+    yield service
+    await service.close()
+
+
+def api_log_rows(service):
+    """Rows written to the API log table so far"""
+    return service.client.tables.get(API_LOGS_TABLE, [])
+
+
+async def wait_for_rows(service, count):
+    """Wait for the background flush task to write at least count rows"""
+    async def poll():
+        while len(api_log_rows(service)) < count:
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(poll(), timeout=2)
+
+
+async def log_request(service, correlation_id):
+    await service.log_api_request(
+        correlation_id=correlation_id,
+        endpoint="/evaluate-call",
+        status_code=200,
+        processing_time_ms=120
+    )
+
+
+class TestApiRequestLogging:
+    """Test cases for buffered API request logging"""
+
+    @pytest.mark.asyncio
+    async def test_log_calls_become_one_batch_insert(self, db_service):
+        """Test several log calls are written with a single insert"""
+        with patch.object(
+            db_service, '_insert_api_logs', wraps=db_service._insert_api_logs
+        ) as mock_insert:
+            for i in range(3):
+                await log_request(db_service, f"corr_{i}")
+
+            await wait_for_rows(db_service, 3)
+
+            mock_insert.assert_awaited_once()
+            assert len(mock_insert.await_args.args[0]) == 3
+
+        assert [row["correlation_id"] for row in api_log_rows(db_service)] == [
+            "corr_0", "corr_1", "corr_2"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_flush_drains_pending_rows(self, db_service):
+        """Test flush writes buffered rows without waiting for the flush task"""
+        await log_request(db_service, "corr_1")
+        await log_request(db_service, "corr_2")
+
+        await db_service.flush()
+
+        assert len(api_log_rows(db_service)) == 2
+        assert db_service._log_buffer.empty()
+
+    @pytest.mark.asyncio
+    async def test_close_drains_and_cancels_flusher(self, db_service):
+        """Test close writes pending rows and stops the flush task"""
+        await log_request(db_service, "corr_1")
+        await log_request(db_service, "corr_2")
+        flush_task = db_service._flush_task
+
+        await db_service.close()
+
+        assert len(api_log_rows(db_service)) == 2
+        assert flush_task.done()
+        assert db_service._flush_task is None
+
+    @pytest.mark.asyncio
+    async def test_failed_insert_does_not_stop_flusher(self, db_service):
+        """Test the flush task keeps running after a batch insert fails"""
+        table = db_service.client.table
+        attempts = []
+
+        def flaky_table(name):
+            attempts.append(name)
+            if len(attempts) == 1:
+                raise ConnectionError("Supabase unavailable")
+            return table(name)
+
+        with patch.object(db_service.client, 'table', side_effect=flaky_table):
+            await log_request(db_service, "corr_lost")
+
+            async def wait_for_attempt():
+                while not attempts:
+                    await asyncio.sleep(0.01)
+
+            await asyncio.wait_for(wait_for_attempt(), timeout=2)
+            flush_task = db_service._flush_task
+
+            await log_request(db_service, "corr_kept")
+            await wait_for_rows(db_service, 1)
+
+        assert not flush_task.done()
+        assert db_service._flush_task is flush_task
+        assert [row["correlation_id"] for row in api_log_rows(db_service)] == ["corr_kept"]
+
+
+class TestHealthCheck:
+    """Test cases for the cached database health check"""
+
+    @pytest.mark.asyncio
+    async def test_result_is_reused_within_ttl(self, db_service):
+        """Test a second call within the TTL does not probe the database"""
+        with patch.object(
+            db_service, '_probe_health', new=AsyncMock(return_value=True)
+        ) as mock_probe:
+            assert await db_service.health_check() is True
+            assert await db_service.health_check() is True
+
+            mock_probe.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_force_refresh_probes_database(self, db_service):
+        """Test force_refresh bypasses a fresh cached result"""
+        with patch.object(
+            db_service, '_probe_health', new=AsyncMock(side_effect=[True, False])
+        ) as mock_probe:
+            assert await db_service.health_check() is True
+            assert await db_service.health_check(force_refresh=True) is False
+
+            assert mock_probe.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_result_probes_database(self, db_service):
+        """Test a result older than the TTL is not reused"""
+        with patch.object(
+            db_service, '_probe_health', new=AsyncMock(return_value=True)
+        ) as mock_probe:
+            await db_service.health_check()
+
+            checked_at, result = db_service._health_cache
+            db_service._health_cache = (checked_at - HEALTH_CHECK_TTL_SECONDS, result)
+            await db_service.health_check()
+
+            assert mock_probe.await_count == 2
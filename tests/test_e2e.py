@@ -2,99 +2,154 @@
 """
 End-to-End Test Script for Eavesly API
 """
-import requests
-import json
+import asyncio
+import sys
+from contextvars import ContextVar
+import httpx
+import orjson
+import pytest
+import pytest_asyncio
+import secrets
 import time
 
 # Test configuration
 BASE_URL = "http://localhost:3000"
 API_KEY = "test_internal_key_12345678"
 
-def test_health_check():
+# Run timestamp shared by every call_id generated in this process
+_RUN_TS = time.strftime("%Y%m%d_%H%M%S")
+
+# Keep-alive pool for the client shared by every check
+CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=40, keepalive_expiry=30.0)
+
+def make_client() -> httpx.AsyncClient:
+    """Pooled client that retries failed connection attempts"""
+    return httpx.AsyncClient(
+        timeout=30.0,
+        transport=httpx.AsyncHTTPTransport(limits=CLIENT_LIMITS, retries=2)
+    )
+
+# Evaluation request body, built once at import time (call_id is set per run)
+SAMPLE_PAYLOAD = {
+    "agent_id": "agent_test_001",
+    "call_context": "First Call",
+    "transcript": {
+        "transcript": "Agent: Hello, this is Sarah from Pennie. I understand you're interested in our loan services. Can I get your name? Client: Yes, it's John Smith. Agent: Great John, let me tell you about our current rates...",
+        "metadata": {
+            "duration": 60,
+            "timestamp": "2024-01-15T10:30:00Z",
+            "talk_time": 50,
+            "disposition": "completed"
+        }
+    },
+    "ideal_script": "Section 1: Introduction and greeting\\nSection 2: Needs assessment\\nSection 3: Product presentation",
+    "client_data": {
+        "lead_id": "lead_test_123",
+        "script_progress": {
+            "sections_attempted": [1, 2, 3],
+            "last_completed_section": 3,
+            "termination_reason": "completed"
+        },
+        "financial_profile": {
+            "annual_income": 50000.0,
+            "dti_ratio": 0.3,
+            "loan_approval_status": "pending"
+        }
+    }
+}
+
+# Per-check output buffer; each concurrent check writes its lines in one go
+_output: ContextVar = ContextVar("output", default=None)
+
+def report(text: str = ""):
+    """Buffer a line of check output, or print it when no buffer is active"""
+    buffer = _output.get()
+    if buffer is None:
+        print(text)
+    else:
+        buffer.append(f"{text}\n")
+
+# Under pytest, every check runs on one session event loop so the client
+# fixture below (and its connection pool) is built once and shared
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def live_client():
+    """Shared client for the running server when the checks are collected by pytest"""
+    async with make_client() as client:
+        yield client
+
+async def test_health_check(live_client: httpx.AsyncClient):
     """Test health check endpoint"""
-    print("Testing health check...")
-    response = requests.get(f"{BASE_URL}/health")
-    print(f"Health check status: {response.status_code}")
+    report("Testing health check...")
+    response = await live_client.get(f"{BASE_URL}/health")
+    report(f"Health check status: {response.status_code}")
+    assert response.status_code == 200
     
-    if response.status_code == 200:
-        health = response.json()
-        print(f"Health status: {health['status']}")
-        print(f"Database: {health['dependencies']['database']}")
-        print(f"Orchestrator: {health['dependencies']['orchestrator']}")
-        return health['status'] == 'healthy'
-    return False
+    health = orjson.loads(response.content)
+    report(f"Health status: {health['status']}")
+    report(f"Database: {health['dependencies']['database']}")
+    report(f"Orchestrator: {health['dependencies']['orchestrator']}")
+    assert health['status'] == 'healthy'
 
-def test_api_evaluation():
+async def test_api_evaluation(live_client: httpx.AsyncClient):
     """Test the main evaluation endpoint"""
-    print("\nTesting evaluation endpoint...")
+    report("\nTesting evaluation endpoint...")
     
     headers = {
         "Content-Type": "application/json",
         "Authorization": f"Bearer {API_KEY}"
     }
     
-    payload = {
-        "call_id": f"test_call_{int(time.time())}",
-        "agent_id": "agent_test_001",
-        "call_context": "First Call",
-        "transcript": {
-            "transcript": "Agent: Hello, this is Sarah from Pennie. I understand you're interested in our loan services. Can I get your name? Client: Yes, it's John Smith. Agent: Great John, let me tell you about our current rates...",
-            "metadata": {
-                "duration": 60,
-                "timestamp": "2024-01-15T10:30:00Z",
-                "talk_time": 50,
-                "disposition": "completed"
-            }
-        },
-        "ideal_script": "Section 1: Introduction and greeting\\nSection 2: Needs assessment\\nSection 3: Product presentation",
-        "client_data": {
-            "lead_id": "lead_test_123",
-            "script_progress": {
-                "sections_attempted": [1, 2, 3],
-                "last_completed_section": 3,
-                "termination_reason": "completed"
-            },
-            "financial_profile": {
-                "annual_income": 50000.0,
-                "dti_ratio": 0.3,
-                "loan_approval_status": "pending"
-            }
-        }
-    }
+    # Unique call_id per request; the rest of the payload is a shared constant
+    payload = {**SAMPLE_PAYLOAD, "call_id": f"test_call_{_RUN_TS}_{secrets.token_hex(4)}"}
     
-    print("Sending evaluation request...")
-    response = requests.post(f"{BASE_URL}/api/v1/evaluate-call", 
-                           headers=headers, 
-                           json=payload)
+    report("Sending evaluation request...")
+    response = await live_client.post(f"{BASE_URL}/api/v1/evaluate-call", 
+                                      headers=headers, 
+                                      content=orjson.dumps(payload))
     
-    print(f"Response status: {response.status_code}")
+    report(f"Response status: {response.status_code}")
+    assert response.status_code == 200, f"Error: {response.text}"
     
-    if response.status_code == 200:
-        result = response.json()
-        print(f"Call ID: {result['call_id']}")
-        print(f"Correlation ID: {result['correlation_id']}")
-        print(f"Overall Score: {result['overall_score']}")
-        print(f"Processing Time: {result['processing_time_ms']}ms")
-        print("Evaluation completed successfully!")
-        return True
-    else:
-        print(f"Error: {response.text}")
-        return False
+    result = orjson.loads(response.content)
+    report(f"Call ID: {result['call_id']}")
+    report(f"Correlation ID: {result['correlation_id']}")
+    report(f"Overall Score: {result['overall_score']}")
+    report(f"Processing Time: {result['processing_time_ms']}ms")
+    report("Evaluation completed successfully!")
 
-def test_root_endpoint():
+async def test_root_endpoint(live_client: httpx.AsyncClient):
     """Test root endpoint"""
-    print("\nTesting root endpoint...")
-    response = requests.get(f"{BASE_URL}/")
-    print(f"Root endpoint status: {response.status_code}")
+    report("\nTesting root endpoint...")
+    response = await live_client.get(f"{BASE_URL}/")
+    report(f"Root endpoint status: {response.status_code}")
+    assert response.status_code == 200
     
-    if response.status_code == 200:
-        root = response.json()
-        print(f"API: {root['message']}")
-        print(f"Version: {root['version']}")
-        return True
-    return False
+    root = orjson.loads(response.content)
+    report(f"API: {root['message']}")
+    report(f"Version: {root['version']}")
+
+async def _run_check(test_name, test_func, client):
+    """Run one check and report its outcome as soon as it completes"""
+    # gather runs each check in its own task, so this buffer is private to it
+    buffer = []
+    _output.set(buffer)
+    try:
+        await test_func(client)
+    except AssertionError as e:
+        report(f"❌ {test_name} failed: {e or 'assertion failed'}")
+        passed = False
+    except Exception as e:
+        report(f"❌ {test_name} failed with error: {e}")
+        passed = False
+    else:
+        report(f"✅ {test_name} finished")
+        passed = True
+    sys.stdout.write("".join(buffer))
+    return passed
 
-def main():
+async def main():
     """Run all end-to-end tests"""
     print("🚀 Starting End-to-End Tests for Eavesly API")
     print("=" * 50)
@@ -105,14 +160,12 @@ def main():
         ("API Evaluation", test_api_evaluation)
     ]
     
-    results = {}
-    
-    for test_name, test_func in tests:
-        try:
-            results[test_name] = test_func()
-        except Exception as e:
-            print(f"❌ {test_name} failed with error: {e}")
-            results[test_name] = False
+    # The checks are independent, so run them concurrently over one client
+    async with make_client() as client:
+        outcomes = await asyncio.gather(
+            *(_run_check(test_name, test_func, client) for test_name, test_func in tests)
+        )
+    results = dict(zip((test_name for test_name, _ in tests), outcomes))
     
     print("\n" + "=" * 50)
     print("📊 Test Results Summary:")
@@ -133,5 +186,12 @@ def main():
     return all_passed
 
 if __name__ == "__main__":
-    success = main()
-    exit(0 if success else 1)
\ No newline at end of file
+    # uvloop ships with uvicorn[standard]; fall back to the default loop without it
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
+    success = asyncio.run(main())
+    sys.exit(0 if success else 1)
\ No newline at end of file
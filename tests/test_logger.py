@@ -0,0 +1,98 @@
+"""
+Tests for the structured logging utilities.
+"""
+
+import json
+import logging
+import queue
+import sys
+
+import pytest
+
+from app.utils.logger import BufferedRotatingFileHandler, JSONFormatter, StructuredQueueHandler
+
+
+def make_record(message: str = "hello", level: int = logging.INFO) -> logging.LogRecord:
+    """Build a plain log record without going through a logger"""
+    return logging.LogRecord("test", level, __file__, 1, message, None, None)
+
+
+class TestBufferedRotatingFileHandler:
+    """Test cases for BufferedRotatingFileHandler"""
+    
+    @pytest.fixture
+    def log_path(self, tmp_path):
+        """Path of the log file under test"""
+        return tmp_path / "app.log"
+    
+    @pytest.fixture
+    def handler(self, log_path):
+        """Handler whose periodic flush never fires during a test"""
+        handler = BufferedRotatingFileHandler(
+            str(log_path), maxBytes=1024 * 1024, backupCount=1, flush_interval=3600
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        yield handler
+        handler.close()
+    
+    def test_emit_buffers_until_flush(self, handler, log_path):
+        """Test that records stay in the buffer until the handler flushes"""
+        handler.emit(make_record("hello"))
+        handler.emit(make_record("world"))
+        
+        assert log_path.stat().st_size == 0
+        
+        handler.flush()
+        assert log_path.read_text() == "hello\nworld\n"
+    
+    def test_high_severity_record_is_flushed(self, handler, log_path):
+        """Test that records at flush_level are written immediately"""
+        handler.emit(make_record("boom", level=logging.ERROR))
+        
+        assert log_path.read_text() == "boom\n"
+    
+    def test_rollover_uses_tracked_size(self, log_path):
+        """Test that rotation happens on size without flushing each record"""
+        handler = BufferedRotatingFileHandler(
+            str(log_path), maxBytes=25, backupCount=1, flush_interval=3600
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        try:
+            handler.emit(make_record("123456789"))
+            handler.emit(make_record("abcdefghi"))
+            
+            # Both 10-byte records are still buffered, but their size is counted
+            assert log_path.stat().st_size == 0
+            assert not handler.shouldRollover(make_record())
+            
+            handler.emit(make_record("rolled"))
+            handler.flush()
+        finally:
+            handler.close()
+        
+        assert (log_path.parent / "app.log.1").read_text() == "123456789\nabcdefghi\n"
+        assert log_path.read_text() == "rolled\n"
+
+
+class TestStructuredQueueHandler:
+    """Test cases for StructuredQueueHandler"""
+    
+    def test_exception_survives_the_queue(self):
+        """Test that the file JSON keeps the exception as a separate field"""
+        log_queue = queue.SimpleQueue()
+        handler = StructuredQueueHandler(log_queue)
+        
+        try:
+            1 / 0
+        except ZeroDivisionError:
+            record = logging.LogRecord(
+                "test", logging.ERROR, __file__, 1, "failed for %s", ("call_1",), sys.exc_info()
+            )
+        handler.emit(record)
+        
+        data = json.loads(JSONFormatter().format(log_queue.get_nowait()))
+        
+        assert data["message"] == "failed for call_1"
+        # pythonjsonlogger names the field exc_info; the fallback formatter uses exception
+        exception = data.get("exc_info") or data.get("exception")
+        assert "ZeroDivisionError" in exception
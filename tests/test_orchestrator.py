@@ -9,6 +9,8 @@ Tests cover:
 - Deep dive decision logic
 """
 
+import asyncio
+
 import pytest
 import pytest_asyncio
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
@@ -157,7 +159,27 @@ class TestCallQAOrchestrator:
         assert orchestrator.llm_client is not None
         assert orchestrator.prompt_client is not None
         assert orchestrator.fallback_manager is not None
-    
+
+    @pytest.mark.asyncio
+    async def test_initialize_does_not_wait_for_preload(self):
+        """Test a slow template preload neither blocks nor outlives its bound"""
+        orchestrator = CallQAOrchestrator()
+        orchestrator.TEMPLATE_PRELOAD_TIMEOUT_SECONDS = 0.05
+        preload_started = asyncio.Event()
+
+        async def slow_preload(names):
+            preload_started.set()
+            await asyncio.sleep(60)
+
+        with patch.object(
+            orchestrator.prompt_client, 'preload_templates', side_effect=slow_preload
+        ):
+            await asyncio.wait_for(orchestrator.initialize(), timeout=1)
+            assert orchestrator.initialized
+
+            await asyncio.wait_for(orchestrator._preload_task, timeout=1)
+            assert preload_started.is_set()
+
     @pytest.mark.asyncio
     async def test_classify_call_enhanced_variables(self, orchestrator, sample_request, mock_llm_client):
         """Test _classify_call method with enhanced variable mapping"""
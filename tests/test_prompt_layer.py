@@ -6,8 +6,9 @@ and rendering functionality.
 """
 
 import json
+import time
 import pytest
-from datetime import datetime, timedelta
+from datetime import timedelta
 from unittest.mock import AsyncMock, Mock, patch
 from typing import Dict, Any
 
@@ -17,7 +18,9 @@ from app.services.prompt_layer import (
     PromptLayerClient,
     PromptLayerError,
     PromptLayerAPIError,
-    PromptLayerValidationError
+    PromptLayerValidationError,
+    close_promptlayer_client,
+    get_promptlayer_client
 )
 
 
@@ -105,11 +108,11 @@ class TestPromptLayerClient:
         assert not client._is_cache_valid(template_name)
         
         # Fresh cache entry
-        client.cache_timestamps[template_name] = datetime.utcnow()
+        client.cache_timestamps[template_name] = time.monotonic()
         assert client._is_cache_valid(template_name)
         
         # Expired cache entry
-        client.cache_timestamps[template_name] = datetime.utcnow() - timedelta(minutes=10)
+        client.cache_timestamps[template_name] = time.monotonic() - 10 * 60
         assert not client._is_cache_valid(template_name)
     
     def test_cache_template(self, client, sample_string_template):
@@ -121,7 +124,22 @@ class TestPromptLayerClient:
         assert template_name in client.templates_cache
         assert client.templates_cache[template_name] == sample_string_template
         assert template_name in client.cache_timestamps
-        assert isinstance(client.cache_timestamps[template_name], datetime)
+        assert isinstance(client.cache_timestamps[template_name], float)
+
+    def test_cache_lru_eviction(self, mock_api_key, sample_string_template):
+        """Test least recently used templates are evicted over capacity"""
+        client = PromptLayerClient(api_key=mock_api_key, cache_max_entries=2)
+
+        client._cache_template("template1", sample_string_template)
+        client._cache_template("template2", sample_string_template)
+
+        # Touch template1 so template2 becomes least recently used
+        client.templates_cache.move_to_end("template1")
+        client._cache_template("template3", sample_string_template)
+
+        assert list(client.templates_cache) == ["template1", "template3"]
+        assert "template2" not in client.cache_timestamps
+        assert "template2" not in client._versions_by_name
 
     @pytest.mark.asyncio
     async def test_fetch_template_success(self, client, sample_string_template):
@@ -294,6 +312,17 @@ class TestPromptLayerClient:
         
         assert result == expected
     
+    def test_render_string_template_non_identifier_keys(self, client):
+        """Test placeholders that are not Python identifiers are substituted"""
+        template = "Hi {{user-name}}, you are {{1st}} in {{queue.name}}"
+        variables = {"user-name": "Bob", "1st": "first", "queue.name": "sales"}
+        
+        with patch.object(client.logger, 'warning') as mock_warning:
+            result = client.render_template(template, variables)
+        
+        assert result == "Hi Bob, you are first in sales"
+        mock_warning.assert_not_called()
+    
     def test_render_string_template_complex_variables(self, client):
         """Test string template rendering with complex variables"""
         template = "Data: {{data}}"
@@ -305,6 +334,24 @@ class TestPromptLayerClient:
         assert '"items": [' in result  # Allow for formatting differences
         assert '"total": 6' in result
     
+    def test_render_template_serializes_each_variable_once(self, client):
+        """Test complex variables reused across messages are encoded once"""
+        template = [
+            {"role": "system", "content": "{{data}}"},
+            {"role": "user", "content": "Review: {{data}}"}
+        ]
+        variables = {"data": {"items": [1, 2, 3]}}
+
+        with patch(
+            "app.services.prompt_layer.json.dumps", wraps=json.dumps
+        ) as mock_dumps:
+            result = client.render_template(template, variables)
+
+        expected = json.dumps(variables["data"], ensure_ascii=False, indent=2)
+        assert result[0]["content"] == expected
+        assert result[1]["content"] == f"Review: {expected}"
+        mock_dumps.assert_called_once()
+
     def test_render_chat_template(self, client, sample_chat_template):
         """Test chat template rendering"""
         variables = {"name": "Bob", "task": "writing an email"}
@@ -372,6 +419,21 @@ class TestPromptLayerClient:
         assert template_name not in client.templates_cache
         assert f"{template_name}:v2" not in client.templates_cache
         assert "other_template" in client.templates_cache
+        assert set(client._versions_by_name) == {"other_template"}
+    
+    def test_clear_cache_specific_version(self, client, sample_string_template):
+        """Test clearing a versioned key leaves the other versions cached"""
+        client._cache_template("test_template", sample_string_template)
+        client._cache_template("test_template:v2", sample_string_template)
+        client._cache_template("test_template:v3", sample_string_template)
+        
+        client.clear_cache("test_template:v2")
+        
+        assert "test_template:v2" not in client.templates_cache
+        assert "test_template:v2" not in client.cache_timestamps
+        assert "test_template" in client.templates_cache
+        assert "test_template:v3" in client.templates_cache
+        assert client._versions_by_name["test_template"] == {"test_template", "test_template:v3"}
     
     def test_clear_cache_all_templates(self, client, sample_string_template):
         """Test clearing all cached templates"""
@@ -399,13 +461,34 @@ class TestPromptLayerClient:
         
         # Add expired cache entry
         client._cache_template("template2", sample_string_template)
-        client.cache_timestamps["template2"] = datetime.utcnow() - timedelta(hours=2)
+        client.cache_timestamps["template2"] = time.monotonic() - 2 * 60 * 60
         
         stats = client.get_cache_stats()
         assert stats["total_cached"] == 2
         assert stats["valid_cached"] == 1
         assert stats["expired_cached"] == 1
     
+    @pytest.mark.asyncio
+    async def test_preload_templates(self, client, sample_string_template):
+        """Test preloading fetches every template and tolerates failures"""
+        fetch_results = {
+            "template1": sample_string_template,
+            "template2": PromptLayerAPIError(404, "Template 'template2' not found"),
+        }
+
+        async def fake_fetch(name):
+            result = fetch_results[name]
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        with patch.object(
+            client, 'fetch_prompt_template', side_effect=fake_fetch
+        ) as mock_fetch:
+            await client.preload_templates(["template1", "template2"])
+
+            assert mock_fetch.await_count == 2
+
     @pytest.mark.asyncio
     async def test_close_client(self, client):
         """Test closing the HTTP client"""
@@ -442,6 +525,22 @@ class TestPromptLayerExceptions:
         assert str(error) == "Invalid template format"
 
 
+class TestSharedClient:
+    """Test the process-wide PromptLayer client"""
+
+    @pytest.mark.asyncio
+    async def test_get_promptlayer_client_is_shared(self):
+        """Test the shared client is reused until closed"""
+        with patch.dict('os.environ', {'PROMPTLAYER_API_KEY': 'test_key'}):
+            client = get_promptlayer_client()
+            assert get_promptlayer_client() is client
+
+            await close_promptlayer_client()
+            assert get_promptlayer_client() is not client
+
+            await close_promptlayer_client()
+
+
 class TestIntegrationScenarios:
     """Integration test scenarios"""
     
@@ -560,7 +659,7 @@ class TestIntegrationScenarios:
         assert client._is_cache_valid(template_name)
         
         # Manually expire cache
-        client.cache_timestamps[template_name] = datetime.utcnow() - timedelta(hours=1)
+        client.cache_timestamps[template_name] = time.monotonic() - 60 * 60
         assert not client._is_cache_valid(template_name)
         
         # Cache stats should reflect expiration